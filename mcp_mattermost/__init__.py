@@ -9,11 +9,15 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-# Optional imports to avoid dependency issues when just using models
-try:
-    from .server import MattermostMCPServer
+from typing import Any
 
-    __all__ = ["MattermostMCPServer"]
-except ImportError:
-    # If server dependencies are not available, just export the models
-    __all__ = []
+__all__ = ["MattermostMCPServer"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the server lazily so model-only users skip its dependencies."""
+    if name == "MattermostMCPServer":
+        from .server import MattermostMCPServer
+
+        return MattermostMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -300,8 +300,28 @@ async def async_main() -> None:
         sys.exit(1)
 
 
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop when it is installed.
+
+    uvloop is an optional speedup (``pip install mattermost-mcp-python[speedups]``)
+    that lowers the scheduling overhead of the streaming and polling tasks.
+
+    Returns:
+        True if the uvloop event loop policy was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def main() -> None:
     """Synchronous main entry point for console scripts."""
+    install_uvloop()
     asyncio.run(async_main())
 
 
@@ -14,6 +14,7 @@ from urllib.parse import urljoin
 
 import httpx
 import structlog
+from pydantic import BaseModel
 
 from ..metrics import metrics
 from .exceptions import (
@@ -81,6 +82,7 @@ class AsyncHTTPClient:
         rate_limit_burst: int = 20,
         headers: Optional[Dict[str, str]] = None,
         verify_ssl: bool = True,
+        max_connections: int = 32,
     ):
         """
         Initialize the HTTP client.
@@ -96,6 +98,7 @@ class AsyncHTTPClient:
             rate_limit_burst: Maximum burst requests
             headers: Default headers for all requests
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Maximum pooled connections, all kept alive
         """
         self.base_url = base_url.rstrip("/")
         self.token = token
@@ -104,6 +107,7 @@ class AsyncHTTPClient:
         self.retry_backoff_factor = retry_backoff_factor
         self.retry_on_status = retry_on_status or [429, 500, 502, 503, 504]
         self.verify_ssl = verify_ssl
+        self.max_connections = max_connections
 
         # Rate limiter
         self.rate_limiter = RateLimiter(
@@ -142,6 +146,12 @@ class AsyncHTTPClient:
                 timeout=httpx.Timeout(self.timeout),
                 verify=self.verify_ssl,
                 follow_redirects=True,
+                # Keep every pooled connection alive so concurrent polls reuse
+                # them instead of reconnecting (httpx keeps only 20 by default)
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
             )
         return self._client
 
@@ -178,7 +188,11 @@ class AsyncHTTPClient:
         if data is None:
             return None, headers
 
-        if isinstance(data, (dict, list)):
+        if isinstance(data, BaseModel):
+            # Serialize straight from the model, skipping the dict round-trip
+            headers["Content-Type"] = "application/json"
+            return data.model_dump_json(exclude_none=True), headers
+        elif isinstance(data, (dict, list)):
             # JSON data
             serialized = json.dumps(data, separators=(",", ":"))
             headers["Content-Type"] = "application/json"
@@ -209,7 +223,9 @@ class AsyncHTTPClient:
 
         return response.text
 
-    async def _handle_response(self, response: httpx.Response) -> Any:
+    async def _handle_response(
+        self, response: httpx.Response, raw: bool = False
+    ) -> Any:
         """Handle response and check for errors."""
         # Handle rate limiting
         if response.status_code == 429:
@@ -242,6 +258,9 @@ class AsyncHTTPClient:
 
             raise create_http_exception(response)
 
+        if raw:
+            return response.content
+
         return self._parse_response_data(response)
 
     async def _make_request_with_retries(
@@ -321,6 +340,7 @@ class AsyncHTTPClient:
         json: Any = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> Any:
         """
         Make an HTTP request with comprehensive metrics collection and error handling.
@@ -328,13 +348,14 @@ class AsyncHTTPClient:
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             endpoint: API endpoint or full URL
-            data: Request data (will be JSON-serialized if dict/list)
+            data: Request data (JSON-serialized if a model, dict or list)
             json: JSON data (alternative to data parameter)
             params: URL parameters
             headers: Additional headers
+            raw: Return the undecoded response body as bytes
 
         Returns:
-            Parsed response data
+            Parsed response data, or the raw body if ``raw`` is set
         """
         start_time = time.time()
         status_code = 200
@@ -375,7 +396,7 @@ class AsyncHTTPClient:
             status_code = response.status_code
 
             # Handle response
-            result = await self._handle_response(response)
+            result = await self._handle_response(response, raw=raw)
 
             logger.info(
                 "HTTP request completed successfully",
@@ -430,9 +451,12 @@ class AsyncHTTPClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> Any:
         """Make a GET request."""
-        return await self.request("GET", endpoint, params=params, headers=headers)
+        return await self.request(
+            "GET", endpoint, params=params, headers=headers, raw=raw
+        )
 
     async def post(
         self,
@@ -7,6 +7,7 @@ to receive real-time events like new posts, reactions, and other activities.
 
 import asyncio
 import json
+import logging
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, cast
@@ -14,10 +15,15 @@ from urllib.parse import urlparse
 
 import structlog
 import websockets
+from pydantic import TypeAdapter, ValidationError
 from websockets.legacy.client import WebSocketClientProtocol
 
 logger = structlog.get_logger(__name__)
 
+# Decodes event frames with pydantic-core's JSON parser, which is faster than
+# json.loads for Mattermost's nested event payloads
+_EVENT_JSON: TypeAdapter[Any] = TypeAdapter(Any)
+
 
 @dataclass
 class WebSocketMessage:
@@ -95,6 +101,9 @@ class MattermostWebSocketClient:
         self._connection_task: Optional[asyncio.Task] = None
         self._is_connected = False
         self._is_authenticated = False
+        # Set while authenticated; created on first use so it binds to the
+        # running event loop on Python < 3.10
+        self._connected_event: Optional[asyncio.Event] = None
         self._reconnect_attempts = 0
         self._seq_counter = 0
 
@@ -114,6 +123,38 @@ class MattermostWebSocketClient:
         """Whether the WebSocket is connected."""
         return self._is_connected and self._is_authenticated
 
+    def _get_connected_event(self) -> asyncio.Event:
+        """Return the event that is set while the client is authenticated."""
+        if self._connected_event is None:
+            self._connected_event = asyncio.Event()
+            if self.is_connected:
+                self._connected_event.set()
+        return self._connected_event
+
+    def _set_authenticated(self, authenticated: bool) -> None:
+        """Update the authentication state and wake up connection waiters."""
+        self._is_authenticated = authenticated
+        if authenticated:
+            self._get_connected_event().set()
+        elif self._connected_event is not None:
+            self._connected_event.clear()
+
+    async def wait_until_connected(self, timeout: float) -> bool:
+        """Wait for the WebSocket to be connected and authenticated.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the client is connected, False if the timeout expired
+        """
+        if not self.is_connected:
+            try:
+                await asyncio.wait_for(self._get_connected_event().wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return self.is_connected
+
     def on_event(
         self, event_type: str, handler: Callable[[Dict[str, Any]], None]
     ) -> None:
@@ -167,7 +208,7 @@ class MattermostWebSocketClient:
             self._websocket = None
 
         self._is_connected = False
-        self._is_authenticated = False
+        self._set_authenticated(False)
 
         logger.info("Disconnected from Mattermost WebSocket")
 
@@ -226,7 +267,7 @@ class MattermostWebSocketClient:
 
             finally:
                 self._is_connected = False
-                self._is_authenticated = False
+                self._set_authenticated(False)
                 if self._websocket:
                     await self._websocket.close()
                     self._websocket = None
@@ -261,7 +302,7 @@ class MattermostWebSocketClient:
             response = json.loads(response_data)
 
             if response.get("status") == "OK" and response.get("seq_reply") == 1:
-                self._is_authenticated = True
+                self._set_authenticated(True)
                 logger.info("WebSocket authenticated successfully")
             else:
                 raise RuntimeError(f"Authentication failed: {response}")
@@ -277,11 +318,11 @@ class MattermostWebSocketClient:
             raise RuntimeError("WebSocket not connected")
         async for message_data in self._websocket:
             try:
-                data = json.loads(message_data)
+                data = _EVENT_JSON.validate_json(message_data)
                 message = WebSocketMessage.from_dict(data)
                 await self._handle_message(message)
 
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 logger.warning("Failed to parse WebSocket message", error=str(e))
             except Exception as e:
                 logger.error(
@@ -309,14 +350,19 @@ class MattermostWebSocketClient:
 
         # Handle events
         if message.event:
-            logger.debug(
-                "Received WebSocket event",
-                event=message.event,
-                channel_id=(
-                    message.broadcast.get("channel_id") if message.broadcast else None
-                ),
-                user_id=message.broadcast.get("user_id") if message.broadcast else None,
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Received WebSocket event",
+                    event=message.event,
+                    channel_id=(
+                        message.broadcast.get("channel_id")
+                        if message.broadcast
+                        else None
+                    ),
+                    user_id=(
+                        message.broadcast.get("user_id") if message.broadcast else None
+                    ),
+                )
 
             # Call event handlers
             handlers = self._event_handlers.get(message.event, [])
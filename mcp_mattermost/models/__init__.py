@@ -5,6 +5,9 @@ This module contains Pydantic models for all Mattermost data structures
 including channels, posts, users, reactions, and configuration.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Authentication and session models
 from .auth import (
     AccessToken,
@@ -34,8 +37,11 @@ from .auth import (
 # Base models and common types
 from .base import (
     ErrorResponse,
+    InternedStr,
     MattermostBase,
+    MattermostRequest,
     MattermostResponse,
+    MMId,
     StatusOK,
 )
 
@@ -44,6 +50,7 @@ from .channels import (
     Channel,
     ChannelCreate,
     ChannelData,
+    ChannelKind,
     ChannelList,
     ChannelMember,
     ChannelMemberPatch,
@@ -108,33 +115,38 @@ from .users import (
     UsersStats,
 )
 
-# Webhook and integration models
-from .webhooks import (
-    Bot,
-    BotPatch,
-    BotRequest,
-    Command,
-    CommandRequest,
-    CommandResponse,
-    DialogRequest,
-    DialogResponse,
-    IncomingWebhook,
-    IncomingWebhookRequest,
-    IntegrationAction,
-    MessageAttachment,
-    OutgoingWebhook,
-    OutgoingWebhookRequest,
-    PostActionIntegrationRequest,
-    PostActionIntegrationResponse,
-    WebhookPayload,
-)
+# Webhook and integration models are not used by the server itself, so they
+# are imported on first access instead of at package import.
+if TYPE_CHECKING:
+    from .webhooks import (
+        Bot,
+        BotPatch,
+        BotRequest,
+        Command,
+        CommandRequest,
+        CommandResponse,
+        DialogRequest,
+        DialogResponse,
+        IncomingWebhook,
+        IncomingWebhookRequest,
+        IntegrationAction,
+        MessageAttachment,
+        OutgoingWebhook,
+        OutgoingWebhookRequest,
+        PostActionIntegrationRequest,
+        PostActionIntegrationResponse,
+        WebhookPayload,
+    )
 
 __all__ = [
     # Base models
     "MattermostBase",
+    "MattermostRequest",
     "MattermostResponse",
     "StatusOK",
     "ErrorResponse",
+    "MMId",
+    "InternedStr",
     # Authentication
     "Session",
     "LoginRequest",
@@ -197,6 +209,7 @@ __all__ = [
     "ChannelSearch",
     "ChannelMembersGetByIds",
     "ChannelList",
+    "ChannelKind",
     # Posts
     "Post",
     "PostCreate",
@@ -234,3 +247,33 @@ __all__ = [
     "PostActionIntegrationRequest",
     "PostActionIntegrationResponse",
 ]
+
+_LAZY_MODULES = {
+    "Bot": "webhooks",
+    "BotPatch": "webhooks",
+    "BotRequest": "webhooks",
+    "Command": "webhooks",
+    "CommandRequest": "webhooks",
+    "CommandResponse": "webhooks",
+    "DialogRequest": "webhooks",
+    "DialogResponse": "webhooks",
+    "IncomingWebhook": "webhooks",
+    "IncomingWebhookRequest": "webhooks",
+    "IntegrationAction": "webhooks",
+    "MessageAttachment": "webhooks",
+    "OutgoingWebhook": "webhooks",
+    "OutgoingWebhookRequest": "webhooks",
+    "PostActionIntegrationRequest": "webhooks",
+    "PostActionIntegrationResponse": "webhooks",
+    "WebhookPayload": "webhooks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily loaded models on first access."""
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -5,10 +5,38 @@ This module provides base classes and common types used across
 all Mattermost data models.
 """
 
+import sys
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    field_validator,
+)
+from typing_extensions import Annotated
+
+# String interned on validation. Used for low-cardinality values (roles,
+# locales, notification levels) that repeat across bulk responses.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Mattermost entity ID. IDs repeat heavily across bulk responses (the same
+# user and channel on every post), so they are interned the same way.
+MMId = InternedStr
+
+
+def _zero_if_none(v: Any) -> Any:
+    """Map an explicit null timestamp to 0."""
+    return 0 if v is None else v
+
+
+# Server-filled timestamp in milliseconds that defaults to 0. The server
+# normally sends an integer, but an explicit null is accepted as 0 so one odd
+# row cannot fail a whole list response.
+Timestamp = Annotated[int, BeforeValidator(_zero_if_none)]
 
 
 class MattermostBase(BaseModel):
@@ -72,6 +100,16 @@ class MattermostBase(BaseModel):
         return self.delete_at is not None and self.delete_at > 0
 
 
+class MattermostRequest(MattermostBase):
+    """Base class for request bodies sent to the Mattermost API."""
+
+    # Request bodies are built locally, so unknown fields are a caller bug
+    # rather than forward compatibility; this also skips collecting extras.
+    # Most request types are never sent in a given session, so their schemas
+    # are built on first use instead of at import.
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+
 class MattermostResponse(BaseModel):
     """Base class for Mattermost API responses."""
 
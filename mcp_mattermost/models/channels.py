@@ -5,16 +5,44 @@ This module contains Pydantic models for channel entities, memberships,
 statistics, and channel-related data structures.
 """
 
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, RootModel, TypeAdapter
 
-from .base import MattermostBase, MattermostResponse
+from .base import (
+    MattermostBase,
+    MattermostRequest,
+    MattermostResponse,
+    MMId,
+    Timestamp,
+)
 
 
-class ChannelNotifyProps(MattermostBase):
+class ChannelKind(IntEnum):
+    """Channel kind derived from the single-letter channel type."""
+
+    UNKNOWN = -1
+    PUBLIC = 0
+    PRIVATE = 1
+    DIRECT = 2
+    GROUP = 3
+
+
+_CHANNEL_KINDS = {
+    "O": ChannelKind.PUBLIC,
+    "P": ChannelKind.PRIVATE,
+    "D": ChannelKind.DIRECT,
+    "G": ChannelKind.GROUP,
+}
+
+
+class ChannelNotifyProps(MattermostResponse):
     """Channel notification properties for a member."""
 
+    # Server-produced and read-only; no entity id or timestamps to validate.
+    model_config = ConfigDict(frozen=True)
+
     desktop: Optional[str] = Field(
         default=None, description="Desktop notification level"
     )
@@ -29,7 +57,7 @@ class ChannelNotifyProps(MattermostBase):
 class Channel(MattermostBase):
     """Mattermost channel model."""
 
-    team_id: Optional[str] = Field(default=None, description="ID of the team")
+    team_id: Optional[MMId] = Field(default=None, description="ID of the team")
     type: Optional[str] = Field(
         default=None,
         description="Channel type (O=public, P=private, D=direct, G=group)",
@@ -40,52 +68,57 @@ class Channel(MattermostBase):
     name: Optional[str] = Field(default=None, description="Channel name")
     header: Optional[str] = Field(default=None, description="Channel header")
     purpose: Optional[str] = Field(default=None, description="Channel purpose")
-    last_post_at: Optional[int] = Field(
-        default=None, description="Timestamp of last post in the channel"
+    last_post_at: Timestamp = Field(
+        default=0, description="Timestamp of last post in the channel"
     )
     total_msg_count: Optional[int] = Field(
         default=None, description="Total message count in the channel"
     )
-    extra_update_at: Optional[int] = Field(
-        default=None, description="Deprecated field from Mattermost 5.0"
+    extra_update_at: Timestamp = Field(
+        default=0, description="Deprecated field from Mattermost 5.0"
     )
-    creator_id: Optional[str] = Field(
+    creator_id: Optional[MMId] = Field(
         default=None, description="ID of the user who created the channel"
     )
 
+    @property
+    def channel_kind(self) -> ChannelKind:
+        """Get the channel kind for the channel type."""
+        return _CHANNEL_KINDS.get(self.type or "", ChannelKind.UNKNOWN)
+
     @property
     def is_private(self) -> bool:
         """Check if the channel is private."""
-        return self.type == "P"
+        return self.channel_kind is ChannelKind.PRIVATE
 
     @property
     def is_public(self) -> bool:
         """Check if the channel is public."""
-        return self.type == "O"
+        return self.channel_kind is ChannelKind.PUBLIC
 
     @property
     def is_direct_message(self) -> bool:
         """Check if the channel is a direct message."""
-        return self.type == "D"
+        return self.channel_kind is ChannelKind.DIRECT
 
     @property
     def is_group_message(self) -> bool:
         """Check if the channel is a group message."""
-        return self.type == "G"
+        return self.channel_kind is ChannelKind.GROUP
 
 
-class ChannelCreate(MattermostBase):
+class ChannelCreate(MattermostRequest):
     """Channel creation request."""
 
     team_id: str = Field(description="Team ID")
     name: str = Field(description="Channel name")
     display_name: str = Field(description="Channel display name")
-    type: str = Field(description="Channel type (O=public, P=private)")
+    type: Literal["O", "P"] = Field(description="Channel type (O=public, P=private)")
     purpose: Optional[str] = Field(default=None, description="Channel purpose")
     header: Optional[str] = Field(default=None, description="Channel header")
 
 
-class ChannelPatch(MattermostBase):
+class ChannelPatch(MattermostRequest):
     """Channel update request."""
 
     name: Optional[str] = None
@@ -97,7 +130,7 @@ class ChannelPatch(MattermostBase):
 class ChannelStats(MattermostResponse):
     """Channel statistics."""
 
-    channel_id: Optional[str] = Field(default=None, description="Channel ID")
+    channel_id: Optional[MMId] = Field(default=None, description="Channel ID")
     member_count: Optional[int] = Field(
         default=None, description="Number of members in the channel"
     )
@@ -106,11 +139,11 @@ class ChannelStats(MattermostResponse):
 class ChannelMember(MattermostBase):
     """Channel membership model."""
 
-    channel_id: Optional[str] = Field(default=None, description="Channel ID")
-    user_id: Optional[str] = Field(default=None, description="User ID")
+    channel_id: Optional[MMId] = Field(default=None, description="Channel ID")
+    user_id: Optional[MMId] = Field(default=None, description="User ID")
     roles: Optional[str] = Field(default=None, description="Member roles")
-    last_viewed_at: Optional[int] = Field(
-        default=None, description="Last time the channel was viewed"
+    last_viewed_at: Timestamp = Field(
+        default=0, description="Last time the channel was viewed"
     )
     msg_count: Optional[int] = Field(
         default=None, description="Message count for this member"
@@ -121,9 +154,7 @@ class ChannelMember(MattermostBase):
     notify_props: Optional[ChannelNotifyProps] = Field(
         default=None, description="Notification properties"
     )
-    last_update_at: Optional[int] = Field(
-        default=None, description="Last update timestamp"
-    )
+    last_update_at: Timestamp = Field(default=0, description="Last update timestamp")
     scheme_user: Optional[bool] = Field(
         default=None, description="Whether this member has the default user role"
     )
@@ -135,26 +166,15 @@ class ChannelMember(MattermostBase):
     )
 
 
-class ChannelMemberWithTeamData(MattermostBase):
+class ChannelMemberWithTeamData(ChannelMember):
     """Channel member with team data."""
 
-    channel_id: Optional[str] = None
-    user_id: Optional[str] = None
-    roles: Optional[str] = None
-    last_viewed_at: Optional[int] = None
-    msg_count: Optional[int] = None
-    mention_count: Optional[int] = None
-    notify_props: Optional[ChannelNotifyProps] = None
-    last_update_at: Optional[int] = None
-    scheme_user: Optional[bool] = None
-    scheme_admin: Optional[bool] = None
-    explicit_roles: Optional[str] = None
     team_display_name: Optional[str] = Field(
         default=None, description="Display name of the team"
     )
     team_name: Optional[str] = Field(default=None, description="Name of the team")
-    team_update_at: Optional[int] = Field(
-        default=None, description="Team last update timestamp"
+    team_update_at: Timestamp = Field(
+        default=0, description="Team last update timestamp"
     )
 
 
@@ -170,20 +190,18 @@ class ChannelData(MattermostResponse):
 class ChannelUnread(MattermostResponse):
     """Channel unread messages count."""
 
-    team_id: Optional[str] = Field(default=None, description="Team ID")
-    channel_id: Optional[str] = Field(default=None, description="Channel ID")
+    team_id: Optional[MMId] = Field(default=None, description="Team ID")
+    channel_id: Optional[MMId] = Field(default=None, description="Channel ID")
     msg_count: Optional[int] = Field(
         default=None, description="Number of unread messages"
     )
     mention_count: Optional[int] = Field(
         default=None, description="Number of unread mentions"
     )
-    last_viewed_at: Optional[int] = Field(
-        default=None, description="Last viewed timestamp"
-    )
+    last_viewed_at: Timestamp = Field(default=0, description="Last viewed timestamp")
 
 
-class ChannelSearch(MattermostBase):
+class ChannelSearch(MattermostRequest):
     """Channel search request."""
 
     term: str = Field(description="Search term")
@@ -209,13 +227,13 @@ class ChannelSearch(MattermostBase):
     per_page: Optional[int] = Field(default=60, description="Results per page")
 
 
-class ChannelMembersGetByIds(MattermostBase):
+class ChannelMembersGetByIds(MattermostRequest):
     """Request to get channel members by user IDs."""
 
     user_ids: List[str] = Field(description="List of user IDs")
 
 
-class ChannelMemberPatch(MattermostBase):
+class ChannelMemberPatch(MattermostRequest):
     """Channel member update request."""
 
     roles: Optional[str] = Field(default=None, description="Updated roles")
@@ -224,9 +242,9 @@ class ChannelMemberPatch(MattermostBase):
     )
 
 
-class ChannelList(MattermostResponse):
-    """List of channels."""
+class ChannelList(RootModel[List[Channel]]):
+    """List of channels, matching the bare JSON array the server returns."""
 
-    channels: Optional[List[Channel]] = Field(
-        default=None, description="List of channels"
-    )
+
+# Shared validator for bulk channel list responses.
+CHANNEL_LIST_ADAPTER: TypeAdapter[List[Channel]] = TypeAdapter(List[Channel])
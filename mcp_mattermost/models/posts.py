@@ -5,11 +5,17 @@ This module contains Pydantic models for post entities, metadata,
 reactions, and post-related data structures.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
-from .base import MattermostBase, MattermostResponse
+from .base import (
+    MattermostBase,
+    MattermostRequest,
+    MattermostResponse,
+    MMId,
+    Timestamp,
+)
 
 if TYPE_CHECKING:
     # Forward references to avoid circular imports
@@ -19,7 +25,7 @@ if TYPE_CHECKING:
 class PostMetadata(MattermostBase):
     """Additional metadata for displaying a post."""
 
-    embeds: Optional[List[Dict[str, Any]]] = Field(
+    embeds: Optional[Any] = Field(
         default=None, description="Embedded content like OpenGraph previews"
     )
     emojis: Optional[List["Emoji"]] = Field(
@@ -28,9 +34,7 @@ class PostMetadata(MattermostBase):
     files: Optional[List["FileInfo"]] = Field(
         default=None, description="File attachments"
     )
-    images: Optional[Dict[str, Dict[str, int]]] = Field(
-        default=None, description="External image dimensions"
-    )
+    images: Optional[Any] = Field(default=None, description="External image dimensions")
     reactions: Optional[List["Reaction"]] = Field(
         default=None, description="Post reactions"
     )
@@ -39,11 +43,11 @@ class PostMetadata(MattermostBase):
 class Post(MattermostBase):
     """Mattermost post model."""
 
-    user_id: Optional[str] = Field(default=None, description="ID of the post author")
-    channel_id: Optional[str] = Field(
+    user_id: Optional[MMId] = Field(default=None, description="ID of the post author")
+    channel_id: Optional[MMId] = Field(
         default=None, description="ID of the channel containing the post"
     )
-    root_id: Optional[str] = Field(
+    root_id: Optional[MMId] = Field(
         default=None, description="ID of the root post (for replies)"
     )
     parent_id: Optional[str] = Field(
@@ -54,9 +58,7 @@ class Post(MattermostBase):
     )
     message: Optional[str] = Field(default=None, description="Post message content")
     type: Optional[str] = Field(default=None, description="Post type")
-    props: Optional[Dict[str, Any]] = Field(
-        default=None, description="Additional post properties"
-    )
+    props: Optional[Any] = Field(default=None, description="Additional post properties")
     hashtag: Optional[str] = Field(default=None, description="Post hashtags")
     filenames: Optional[List[str]] = Field(
         default=None, description="Deprecated file attachments field"
@@ -67,8 +69,8 @@ class Post(MattermostBase):
     pending_post_id: Optional[str] = Field(
         default=None, description="Temporary ID for pending posts"
     )
-    edit_at: Optional[int] = Field(
-        default=None, description="Timestamp when the post was last edited"
+    edit_at: Timestamp = Field(
+        default=0, description="Timestamp when the post was last edited"
     )
     metadata: Optional[PostMetadata] = Field(
         default=None, description="Additional post metadata"
@@ -82,39 +84,42 @@ class Post(MattermostBase):
     @property
     def is_edited(self) -> bool:
         """Check if this post has been edited."""
-        return self.edit_at is not None and self.edit_at > 0
+        return self.edit_at > 0
 
     @property
     def has_attachments(self) -> bool:
         """Check if this post has file attachments."""
         return bool(self.file_ids)
 
+    @classmethod
+    def validate_many_json(cls, data: Union[str, bytes]) -> List["Post"]:
+        """Validate a JSON array of posts in a single pass."""
+        return POST_LIST_ADAPTER.validate_json(data)
 
-class PostCreate(MattermostBase):
+
+class PostCreate(MattermostRequest):
     """Post creation request."""
 
     channel_id: str = Field(description="Channel ID")
     message: str = Field(description="Post message")
-    root_id: Optional[str] = Field(default=None, description="Root post ID for replies")
+    root_id: Optional[MMId] = Field(
+        default=None, description="Root post ID for replies"
+    )
     file_ids: Optional[List[str]] = Field(
         default=None, description="List of file IDs to attach"
     )
-    props: Optional[Dict[str, Any]] = Field(
-        default=None, description="Additional properties"
-    )
+    props: Optional[Any] = Field(default=None, description="Additional properties")
     type: Optional[str] = Field(default=None, description="Post type")
 
 
-class PostPatch(MattermostBase):
+class PostPatch(MattermostRequest):
     """Post update request."""
 
     message: Optional[str] = Field(default=None, description="Updated message")
     file_ids: Optional[List[str]] = Field(
         default=None, description="Updated file attachments"
     )
-    props: Optional[Dict[str, Any]] = Field(
-        default=None, description="Updated properties"
-    )
+    props: Optional[Any] = Field(default=None, description="Updated properties")
     has_reactions: Optional[bool] = Field(
         default=None, description="Whether the post has reactions"
     )
@@ -149,7 +154,7 @@ class PostListWithSearchMatches(MattermostResponse):
     )
 
 
-class PostSearch(MattermostBase):
+class PostSearch(MattermostRequest):
     """Post search request."""
 
     terms: str = Field(description="Search terms")
@@ -166,7 +171,7 @@ class PostSearch(MattermostBase):
     per_page: Optional[int] = Field(default=60, description="Posts per page")
 
 
-class PostAction(MattermostBase):
+class PostAction(MattermostRequest):
     """Post action (e.g., pin, unpin, flag)."""
 
     post_id: str = Field(description="Post ID")
@@ -176,10 +181,10 @@ class PostAction(MattermostBase):
 class Reaction(MattermostBase):
     """Post reaction model."""
 
-    user_id: Optional[str] = Field(
+    user_id: Optional[MMId] = Field(
         default=None, description="ID of the user who made the reaction"
     )
-    post_id: Optional[str] = Field(
+    post_id: Optional[MMId] = Field(
         default=None, description="ID of the post that was reacted to"
     )
     emoji_name: Optional[str] = Field(
@@ -193,10 +198,10 @@ class Reaction(MattermostBase):
 class FileInfo(MattermostBase):
     """File attachment information."""
 
-    user_id: Optional[str] = Field(
+    user_id: Optional[MMId] = Field(
         default=None, description="ID of the user who uploaded the file"
     )
-    post_id: Optional[str] = Field(
+    post_id: Optional[MMId] = Field(
         default=None, description="ID of the post the file is attached to"
     )
     name: Optional[str] = Field(default=None, description="Original filename")
@@ -213,7 +218,7 @@ class FileInfo(MattermostBase):
 class Emoji(MattermostBase):
     """Custom emoji model."""
 
-    creator_id: Optional[str] = Field(
+    creator_id: Optional[MMId] = Field(
         default=None, description="ID of the user who created the emoji"
     )
     name: Optional[str] = Field(default=None, description="Emoji name")
@@ -300,3 +305,9 @@ class OpenGraph(MattermostBase):
     audios: Optional[List[OpenGraphAudio]] = Field(
         default=None, description="OpenGraph audio"
     )
+
+
+# Shared validators for bulk responses; building these once avoids
+# re-creating the list/dict schema on every call.
+POST_LIST_ADAPTER: TypeAdapter[List[Post]] = TypeAdapter(List[Post])
+POST_DICT_ADAPTER: TypeAdapter[Dict[str, Post]] = TypeAdapter(Dict[str, Post])
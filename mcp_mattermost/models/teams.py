@@ -5,11 +5,13 @@ This module contains Pydantic models for team entities, memberships,
 statistics, and team-related data structures.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, RootModel, TypeAdapter
 
-from .base import MattermostBase, MattermostResponse
+from .base import MattermostBase, MattermostRequest, MattermostResponse, MMId
+
+TeamType = Literal["O", "I"]
 
 
 class Team(MattermostBase):
@@ -31,12 +33,12 @@ class Team(MattermostBase):
     )
 
 
-class TeamCreate(MattermostBase):
+class TeamCreate(MattermostRequest):
     """Team creation request."""
 
     name: str = Field(description="Team name")
     display_name: str = Field(description="Team display name")
-    type: str = Field(description="Team type (O=open, I=invite)")
+    type: TeamType = Field(description="Team type (O=open, I=invite)")
     description: Optional[str] = Field(default=None, description="Team description")
     allowed_domains: Optional[str] = Field(
         default=None, description="Comma-separated list of allowed domains"
@@ -46,7 +48,7 @@ class TeamCreate(MattermostBase):
     )
 
 
-class TeamPatch(MattermostBase):
+class TeamPatch(MattermostRequest):
     """Team update request."""
 
     display_name: Optional[str] = None
@@ -58,7 +60,7 @@ class TeamPatch(MattermostBase):
 class TeamStats(MattermostResponse):
     """Team statistics."""
 
-    team_id: Optional[str] = Field(default=None, description="Team ID")
+    team_id: Optional[MMId] = Field(default=None, description="Team ID")
     total_member_count: Optional[int] = Field(
         default=None, description="Total number of members"
     )
@@ -70,16 +72,18 @@ class TeamStats(MattermostResponse):
 class TeamExists(MattermostResponse):
     """Team existence check response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     exists: Optional[bool] = Field(default=None, description="Whether the team exists")
 
 
 class TeamMember(MattermostBase):
     """Team membership model."""
 
-    team_id: Optional[str] = Field(
+    team_id: Optional[MMId] = Field(
         default=None, description="ID of the team this member belongs to"
     )
-    user_id: Optional[str] = Field(
+    user_id: Optional[MMId] = Field(
         default=None, description="ID of the user this member relates to"
     )
     roles: Optional[str] = Field(
@@ -99,23 +103,16 @@ class TeamMember(MattermostBase):
     )
 
 
-class TeamMemberWithTeam(MattermostBase):
+class TeamMemberWithTeam(TeamMember):
     """Team member with team information."""
 
-    team_id: Optional[str] = None
-    user_id: Optional[str] = None
-    roles: Optional[str] = None
-    delete_at: Optional[int] = None
-    scheme_user: Optional[bool] = None
-    scheme_admin: Optional[bool] = None
-    explicit_roles: Optional[str] = None
     team: Optional[Team] = Field(default=None, description="Team information")
 
 
 class TeamUnread(MattermostResponse):
     """Team unread messages count."""
 
-    team_id: Optional[str] = Field(default=None, description="Team ID")
+    team_id: Optional[MMId] = Field(default=None, description="Team ID")
     msg_count: Optional[int] = Field(
         default=None, description="Number of unread messages"
     )
@@ -124,22 +121,18 @@ class TeamUnread(MattermostResponse):
     )
 
 
-class TeamInvite(MattermostBase):
+class TeamInvite(MattermostRequest):
     """Team invitation model."""
 
     email: str = Field(description="Email address to invite")
     team_id: str = Field(description="Team ID")
 
 
-class TeamMap(MattermostResponse):
+class TeamMap(RootModel[Dict[str, Team]]):
     """A mapping of team IDs to teams."""
 
-    # This is a dynamic dictionary structure
-    # Key is team_id, value is Team object
-    # We'll use model_validate to handle this dynamically
-
 
-class TeamSearch(MattermostBase):
+class TeamSearch(MattermostRequest):
     """Team search request."""
 
     term: str = Field(description="Search term")
@@ -153,7 +146,11 @@ class TeamSearch(MattermostBase):
     )
 
 
-class TeamMembersGetByIds(MattermostBase):
+class TeamMembersGetByIds(MattermostRequest):
     """Request to get team members by user IDs."""
 
     user_ids: List[str] = Field(description="List of user IDs")
+
+
+# Shared validator for bulk team list responses.
+TEAM_LIST_ADAPTER: TypeAdapter[List[Team]] = TypeAdapter(List[Team])
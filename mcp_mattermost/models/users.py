@@ -5,11 +5,11 @@ This module contains Pydantic models for user entities, profiles,
 authentication, and user-related data structures.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
-from .base import MattermostBase, MattermostResponse
+from .base import InternedStr, MattermostBase, MattermostRequest, MattermostResponse
 
 
 class Timezone(MattermostBase):
@@ -29,21 +29,25 @@ class Timezone(MattermostBase):
 class UserNotifyProps(MattermostBase):
     """User notification properties."""
 
-    email: Optional[str] = Field(default=None, description="Email notification setting")
-    push: Optional[str] = Field(default=None, description="Push notification setting")
-    desktop: Optional[str] = Field(
+    email: Optional[InternedStr] = Field(
+        default=None, description="Email notification setting"
+    )
+    push: Optional[InternedStr] = Field(
+        default=None, description="Push notification setting"
+    )
+    desktop: Optional[InternedStr] = Field(
         default=None, description="Desktop notification setting"
     )
-    desktop_sound: Optional[str] = Field(
+    desktop_sound: Optional[InternedStr] = Field(
         default=None, description="Desktop sound notification setting"
     )
     mention_keys: Optional[str] = Field(
         default=None, description="Custom mention keywords"
     )
-    channel: Optional[str] = Field(
+    channel: Optional[InternedStr] = Field(
         default=None, description="Channel-wide notification setting"
     )
-    first_name: Optional[str] = Field(
+    first_name: Optional[InternedStr] = Field(
         default=None, description="First name mention notification setting"
     )
 
@@ -59,17 +63,15 @@ class User(MattermostBase):
     email_verified: Optional[bool] = Field(
         default=None, description="Whether the email is verified"
     )
-    auth_service: Optional[str] = Field(
+    auth_service: Optional[InternedStr] = Field(
         default=None, description="Authentication service used"
     )
-    roles: Optional[str] = Field(default=None, description="User roles")
-    locale: Optional[str] = Field(default=None, description="User's locale")
+    roles: Optional[InternedStr] = Field(default=None, description="User roles")
+    locale: Optional[InternedStr] = Field(default=None, description="User's locale")
     notify_props: Optional[UserNotifyProps] = Field(
         default=None, description="Notification properties"
     )
-    props: Optional[Dict[str, Any]] = Field(
-        default=None, description="Additional user properties"
-    )
+    props: Optional[Any] = Field(default=None, description="Additional user properties")
     last_password_update: Optional[int] = Field(
         default=None, description="Last password update timestamp"
     )
@@ -111,7 +113,7 @@ class User(MattermostBase):
         return self.display_name
 
 
-class UserPatch(MattermostBase):
+class UserPatch(MattermostRequest):
     """Model for updating user properties."""
 
     username: Optional[str] = None
@@ -122,18 +124,20 @@ class UserPatch(MattermostBase):
     locale: Optional[str] = None
     timezone: Optional[Timezone] = None
     notify_props: Optional[UserNotifyProps] = None
-    props: Optional[Dict[str, Any]] = None
+    props: Optional[Any] = None
 
 
 class UsersStats(MattermostResponse):
     """User statistics."""
 
+    model_config = ConfigDict(defer_build=True)
+
     total_users_count: Optional[int] = Field(
         default=None, description="Total number of users"
     )
 
 
-class UserAuthData(MattermostBase):
+class UserAuthData(MattermostRequest):
     """User authentication data."""
 
     auth_data: Optional[str] = Field(
@@ -148,34 +152,26 @@ class UserAuthData(MattermostBase):
 
 
 class UserAutocomplete(MattermostResponse):
-    """User autocomplete response."""
+    """User autocomplete response, whether scoped to a team or a channel."""
 
     users: Optional[List[User]] = Field(
         default=None, description="Main autocomplete results"
     )
-    out_of_channel: Optional[List[User]] = Field(
-        default=None, description="Users not in the current channel"
-    )
-
-
-class UserAutocompleteInTeam(MattermostResponse):
-    """User autocomplete within a team."""
-
     in_team: Optional[List[User]] = Field(default=None, description="Users in the team")
-
-
-class UserAutocompleteInChannel(MattermostResponse):
-    """User autocomplete within a channel."""
-
     in_channel: Optional[List[User]] = Field(
         default=None, description="Users in the channel"
     )
     out_of_channel: Optional[List[User]] = Field(
-        default=None, description="Users not in the channel"
+        default=None, description="Users not in the current channel"
     )
 
 
-class UserLogin(MattermostBase):
+# The team and channel variants share one schema and validator.
+UserAutocompleteInTeam = UserAutocomplete
+UserAutocompleteInChannel = UserAutocomplete
+
+
+class UserLogin(MattermostRequest):
     """User login request."""
 
     login_id: str = Field(description="Login ID (username, email, or AD/LDAP ID)")
@@ -184,7 +180,7 @@ class UserLogin(MattermostBase):
     device_id: Optional[str] = Field(default=None, description="Device identifier")
 
 
-class UserCreate(MattermostBase):
+class UserCreate(MattermostRequest):
     """User creation request."""
 
     username: str = Field(description="Username")
@@ -194,6 +190,8 @@ class UserCreate(MattermostBase):
     last_name: Optional[str] = Field(default=None, description="Last name")
     nickname: Optional[str] = Field(default=None, description="Nickname")
     locale: Optional[str] = Field(default=None, description="User locale")
-    props: Optional[Dict[str, Any]] = Field(
-        default=None, description="Additional properties"
-    )
+    props: Optional[Any] = Field(default=None, description="Additional properties")
+
+
+# Shared validator for bulk user list responses.
+USER_LIST_ADAPTER: TypeAdapter[List[User]] = TypeAdapter(List[User])
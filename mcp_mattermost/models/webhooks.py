@@ -2,20 +2,26 @@
 Webhook and integration-related models for Mattermost.
 
 This module contains Pydantic models for webhooks, slash commands,
-and other integration-related data structures.
+and other integration-related data structures. None of them are used on
+the server's hot paths, so every model defers its schema build to first use.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, PrivateAttr, model_validator
 
-from .base import MattermostBase, MattermostResponse
+from .base import InternedStr, MattermostBase, MattermostRequest, MattermostResponse
 from .posts import SlackAttachment
 
+TriggerWhen = Literal[0, 1]
+WebhookContentType = Literal["application/x-www-form-urlencoded", "application/json"]
+
 
 class IncomingWebhook(MattermostBase):
     """Incoming webhook model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     channel_id: Optional[str] = Field(
         default=None, description="ID of the channel that receives webhook payloads"
     )
@@ -31,7 +37,7 @@ class IncomingWebhook(MattermostBase):
     )
 
 
-class IncomingWebhookRequest(MattermostBase):
+class IncomingWebhookRequest(MattermostRequest):
     """Request to create an incoming webhook."""
 
     channel_id: str = Field(description="Channel ID")
@@ -44,6 +50,8 @@ class IncomingWebhookRequest(MattermostBase):
 class OutgoingWebhook(MattermostBase):
     """Outgoing webhook model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     creator_id: Optional[str] = Field(
         default=None, description="ID of the user who created the webhook"
     )
@@ -64,18 +72,51 @@ class OutgoingWebhook(MattermostBase):
     )
     trigger_when: Optional[int] = Field(
         default=None,
-        description="When to trigger: 0=anywhere in message, 1=start of message",
+        description=(
+            "When to trigger: 0=first word matches a trigger word exactly, "
+            "1=first word starts with a trigger word"
+        ),
     )
     callback_urls: Optional[List[str]] = Field(
         default=None, description="URLs to POST the payload to"
     )
-    content_type: Optional[str] = Field(
+    content_type: Optional[InternedStr] = Field(
         default="application/x-www-form-urlencoded",
         description="Content type for the payload",
     )
 
+    # Trigger words prepared once per validation for is_triggered_by
+    _trigger_word_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _trigger_prefixes: Tuple[str, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="after")
+    def _prepare_trigger_words(self) -> "OutgoingWebhook":
+        """Build the trigger word lookups from trigger_words."""
+        self._trigger_word_set = frozenset(self.trigger_words or ())
+        self._trigger_prefixes = tuple(self._trigger_word_set)
+        return self
+
+    @property
+    def trigger_word_set(self) -> FrozenSet[str]:
+        """Get the trigger words as a set for constant-time lookups."""
+        return self._trigger_word_set
+
+    def is_triggered_by(self, message: str) -> bool:
+        """Check whether a message would trigger this webhook.
 
-class OutgoingWebhookRequest(MattermostBase):
+        Only the first word of the message is considered: with
+        ``trigger_when == 0`` it must equal a trigger word, with
+        ``trigger_when == 1`` it must start with one.
+        """
+        first_word = message.split(maxsplit=1)[:1]
+        if not first_word:
+            return False
+        if self.trigger_when == 1:
+            return first_word[0].startswith(self._trigger_prefixes)
+        return first_word[0] in self._trigger_word_set
+
+
+class OutgoingWebhookRequest(MattermostRequest):
     """Request to create an outgoing webhook."""
 
     team_id: str = Field(description="Team ID")
@@ -83,11 +124,11 @@ class OutgoingWebhookRequest(MattermostBase):
     display_name: str = Field(description="Webhook display name")
     description: Optional[str] = Field(default=None, description="Webhook description")
     trigger_words: List[str] = Field(description="Trigger words")
-    trigger_when: Optional[int] = Field(
+    trigger_when: Optional[TriggerWhen] = Field(
         default=0, description="When to trigger the webhook"
     )
     callback_urls: List[str] = Field(description="Callback URLs")
-    content_type: Optional[str] = Field(
+    content_type: Optional[WebhookContentType] = Field(
         default="application/x-www-form-urlencoded", description="Content type"
     )
 
@@ -95,6 +136,8 @@ class OutgoingWebhookRequest(MattermostBase):
 class Command(MattermostBase):
     """Slash command model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     token: Optional[str] = Field(
         default=None, description="Token for verifying the payload source"
     )
@@ -107,7 +150,9 @@ class Command(MattermostBase):
     trigger: Optional[str] = Field(
         default=None, description="String that triggers the command"
     )
-    method: Optional[str] = Field(default=None, description="HTTP method (GET or POST)")
+    method: Optional[InternedStr] = Field(
+        default=None, description="HTTP method (GET or POST)"
+    )
     username: Optional[str] = Field(
         default=None, description="Username for the response post"
     )
@@ -132,7 +177,7 @@ class Command(MattermostBase):
     url: Optional[str] = Field(default=None, description="URL that is triggered")
 
 
-class CommandRequest(MattermostBase):
+class CommandRequest(MattermostRequest):
     """Request to create a slash command."""
 
     team_id: str = Field(description="Team ID")
@@ -159,7 +204,9 @@ class CommandRequest(MattermostBase):
 class CommandResponse(MattermostResponse):
     """Response from a slash command."""
 
-    ResponseType: Optional[str] = Field(
+    model_config = ConfigDict(defer_build=True)
+
+    ResponseType: Optional[InternedStr] = Field(
         default=None, description="Response type (in_channel or ephemeral)"
     )
     Text: Optional[str] = Field(default=None, description="Response text")
@@ -174,6 +221,8 @@ class CommandResponse(MattermostResponse):
 class Bot(MattermostBase):
     """Bot user model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     user_id: Optional[str] = Field(default=None, description="Bot user ID")
     username: Optional[str] = Field(default=None, description="Bot username")
     display_name: Optional[str] = Field(default=None, description="Bot display name")
@@ -183,7 +232,7 @@ class Bot(MattermostBase):
     )
 
 
-class BotRequest(MattermostBase):
+class BotRequest(MattermostRequest):
     """Request to create a bot."""
 
     username: str = Field(description="Bot username")
@@ -191,7 +240,7 @@ class BotRequest(MattermostBase):
     description: Optional[str] = Field(default=None, description="Bot description")
 
 
-class BotPatch(MattermostBase):
+class BotPatch(MattermostRequest):
     """Request to update a bot."""
 
     username: Optional[str] = Field(default=None, description="Updated username")
@@ -204,6 +253,8 @@ class BotPatch(MattermostBase):
 class WebhookPayload(MattermostBase):
     """Generic webhook payload."""
 
+    model_config = ConfigDict(defer_build=True)
+
     text: Optional[str] = Field(default=None, description="Message text")
     username: Optional[str] = Field(default=None, description="Override username")
     icon_url: Optional[str] = Field(default=None, description="Override icon URL")
@@ -215,32 +266,32 @@ class WebhookPayload(MattermostBase):
         default=None, description="Message attachments"
     )
     type: Optional[str] = Field(default=None, description="Message type")
-    props: Optional[Dict[str, Any]] = Field(
-        default=None, description="Additional properties"
-    )
+    props: Optional[Any] = Field(default=None, description="Additional properties")
 
 
 class IntegrationAction(MattermostBase):
     """Integration action model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: Optional[str] = Field(default=None, description="Action ID")
     name: Optional[str] = Field(default=None, description="Action name")
-    integration: Optional[Dict[str, Any]] = Field(
-        default=None, description="Integration details"
-    )
+    integration: Optional[Any] = Field(default=None, description="Integration details")
 
 
-class DialogRequest(MattermostBase):
+class DialogRequest(MattermostRequest):
     """Interactive dialog request."""
 
     trigger_id: str = Field(description="Trigger ID from the original interaction")
     url: str = Field(description="App's request URL")
-    dialog: Dict[str, Any] = Field(description="Dialog definition")
+    dialog: Any = Field(description="Dialog definition")
 
 
 class DialogResponse(MattermostResponse):
     """Response to a dialog submission."""
 
+    model_config = ConfigDict(defer_build=True)
+
     errors: Optional[Dict[str, str]] = Field(
         default=None, description="Validation errors"
     )
@@ -249,6 +300,8 @@ class DialogResponse(MattermostResponse):
 class MessageAttachment(MattermostBase):
     """Message attachment for interactive messages."""
 
+    model_config = ConfigDict(defer_build=True)
+
     # Inherits from SlackAttachment but adds interactive elements
     actions: Optional[List[Dict[str, Any]]] = Field(
         default=None, description="Interactive actions"
@@ -258,6 +311,8 @@ class MessageAttachment(MattermostBase):
 class PostActionIntegrationRequest(MattermostBase):
     """Post action integration request."""
 
+    model_config = ConfigDict(defer_build=True)
+
     user_id: Optional[str] = Field(default=None, description="User ID")
     user_name: Optional[str] = Field(default=None, description="Username")
     channel_id: Optional[str] = Field(default=None, description="Channel ID")
@@ -268,17 +323,15 @@ class PostActionIntegrationRequest(MattermostBase):
     trigger_id: Optional[str] = Field(default=None, description="Trigger ID")
     type: Optional[str] = Field(default=None, description="Action type")
     data_source: Optional[str] = Field(default=None, description="Data source")
-    context: Optional[Dict[str, Any]] = Field(
-        default=None, description="Additional context"
-    )
+    context: Optional[Any] = Field(default=None, description="Additional context")
 
 
 class PostActionIntegrationResponse(MattermostResponse):
     """Response to a post action integration."""
 
-    update: Optional[Dict[str, Any]] = Field(
-        default=None, description="Post update data"
-    )
+    model_config = ConfigDict(defer_build=True)
+
+    update: Optional[Any] = Field(default=None, description="Post update data")
     ephemeral_text: Optional[str] = Field(
         default=None, description="Ephemeral response text"
     )
@@ -3,17 +3,24 @@ MCP resource implementations for Mattermost data access.
 
 This module provides MCP resources that offer both read-only access to Mattermost
 data and real-time streaming updates via WebSocket or polling mechanisms.
+
+Resources are imported on first access, so importing the package does not pull
+in the WebSocket client and HTTP stack until a resource is actually used.
 """
 
-from .base import (
-    BaseMCPResource,
-    MCPResourceDefinition,
-    MCPResourceRegistry,
-    ResourceUpdate,
-    ResourceUpdateType,
-)
-from .channel_posts import NewChannelPostResource
-from .reactions import ReactionResource
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base import (
+        BaseMCPResource,
+        MCPResourceDefinition,
+        MCPResourceRegistry,
+        ResourceUpdate,
+        ResourceUpdateType,
+    )
+    from .channel_posts import NewChannelPostResource
+    from .reactions import ReactionResource
 
 __all__ = [
     "BaseMCPResource",
@@ -24,3 +31,28 @@ __all__ = [
     "NewChannelPostResource",
     "ReactionResource",
 ]
+
+_LAZY_MODULES = {
+    "BaseMCPResource": "base",
+    "MCPResourceRegistry": "base",
+    "MCPResourceDefinition": "base",
+    "ResourceUpdate": "base",
+    "ResourceUpdateType": "base",
+    "NewChannelPostResource": "channel_posts",
+    "ReactionResource": "reactions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import resource classes on first access."""
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,19 +6,65 @@ through WebSocket events or periodic polling.
 """
 
 import asyncio
+import logging
+import random
+import sys
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 import structlog
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from ..api.client import AsyncHTTPClient
+
 logger = structlog.get_logger(__name__)
 
 
+# How long a team's channel list is reused before it is fetched again
+TEAM_CHANNELS_TTL_SECONDS = 60.0
+
+# Upper bound on the exponential part of the polling error backoff
+MAX_POLL_BACKOFF_SECONDS = 300.0
+
+# While the stream is connected, polling only runs as an occasional sweep for
+# missed events, this many intervals apart
+STREAMING_POLL_INTERVAL_FACTOR = 10
+
+
+def _backoff_delay(interval_seconds: float, consecutive_errors: int) -> float:
+    """
+    Compute the delay before retrying after consecutive polling errors.
+
+    The delay doubles with each error up to ``MAX_POLL_BACKOFF_SECONDS``, plus
+    up to one interval of random jitter so resources that failed together do
+    not retry in lockstep.
+
+    Args:
+        interval_seconds: Normal polling interval
+        consecutive_errors: Number of failed polls in a row (at least 1)
+
+    Returns:
+        Delay in seconds
+    """
+    exponent = min(consecutive_errors, 16)
+    delay = min(interval_seconds * (2**exponent), MAX_POLL_BACKOFF_SECONDS)
+    return delay + random.uniform(0, interval_seconds)
+
+
 class ResourceUpdateType(str, Enum):
     """Types of resource updates."""
 
@@ -27,9 +73,16 @@ class ResourceUpdateType(str, Enum):
     DELETED = "deleted"
     REACTION_ADDED = "reaction_added"
     REACTION_REMOVED = "reaction_removed"
+    DROPPED = "dropped"
+
+
+# Slotted dataclasses need Python 3.10; older versions fall back to a __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ResourceUpdate:
     """Represents a resource update event."""
 
@@ -74,10 +127,19 @@ class BaseMCPResource(ABC):
         self.name = name
         self.description = description
         self.mime_type = mime_type
-        self._subscribers: Set[Callable[[ResourceUpdate], None]] = set()
+        # Immutable snapshot, replaced on (un)subscribe so emits need no copy
+        self._subscribers: Tuple[Callable[[ResourceUpdate], None], ...] = ()
+        # Bounded queue subscribers -> updates dropped since the last delivery
+        self._subscriber_queues: Dict["asyncio.Queue[ResourceUpdate]", int] = {}
+        # Kept in step with both collections so emits test a single flag
+        self._has_subscribers = False
         self._is_streaming = False
         self._polling_task: Optional[asyncio.Task] = None
-        self._last_poll_time: Optional[datetime] = None
+        # Monotonic time of the last completed poll, 0 before the first one
+        self._last_poll_time_ns = 0
+        # Team channel IDs and the monotonic time they must be refetched at
+        self._team_channel_ids: List[str] = []
+        self._team_channel_ids_expires = 0.0
 
     @property
     def uri(self) -> str:
@@ -110,7 +172,9 @@ class BaseMCPResource(ABC):
 
     def subscribe(self, callback: Callable[[ResourceUpdate], None]) -> None:
         """Subscribe to resource updates."""
-        self._subscribers.add(callback)
+        if callback not in self._subscribers:
+            self._subscribers = self._subscribers + (callback,)
+        self._has_subscribers = True
         logger.info(
             "Subscriber added",
             resource=self.name,
@@ -119,26 +183,99 @@ class BaseMCPResource(ABC):
 
     def unsubscribe(self, callback: Callable[[ResourceUpdate], None]) -> None:
         """Unsubscribe from resource updates."""
-        self._subscribers.discard(callback)
+        self._subscribers = tuple(s for s in self._subscribers if s != callback)
+        self._refresh_has_subscribers()
         logger.info(
             "Subscriber removed",
             resource=self.name,
             total_subscribers=len(self._subscribers),
         )
 
-    async def emit_update(self, update: ResourceUpdate) -> None:
-        """Emit a resource update to all subscribers."""
-        if not self._subscribers:
-            return
+    def subscribe_queue(self, maxsize: int = 32) -> "asyncio.Queue[ResourceUpdate]":
+        """
+        Subscribe to resource updates through a bounded queue.
 
-        logger.debug(
-            "Emitting resource update",
+        A consumer that falls behind only fills its own queue. Updates that do
+        not fit are dropped, and a ``DROPPED`` update carrying the number of
+        missed updates is queued once the consumer has caught up.
+
+        Args:
+            maxsize: Maximum number of buffered updates (at least 2)
+
+        Returns:
+            Queue the caller reads updates from
+        """
+        if maxsize < 2:
+            raise ValueError("maxsize must be at least 2")
+
+        queue: "asyncio.Queue[ResourceUpdate]" = asyncio.Queue(maxsize)
+        self._subscriber_queues[queue] = 0
+        self._has_subscribers = True
+        logger.info(
+            "Queue subscriber added",
+            resource=self.name,
+            total_queues=len(self._subscriber_queues),
+        )
+        return queue
+
+    def unsubscribe_queue(self, queue: "asyncio.Queue[ResourceUpdate]") -> None:
+        """Stop delivering updates to a queue returned by subscribe_queue."""
+        self._subscriber_queues.pop(queue, None)
+        self._refresh_has_subscribers()
+        logger.info(
+            "Queue subscriber removed",
             resource=self.name,
-            update_type=update.update_type,
-            subscribers=len(self._subscribers),
+            total_queues=len(self._subscriber_queues),
         )
 
-        for callback in self._subscribers.copy():
+    def _refresh_has_subscribers(self) -> None:
+        """Recompute whether any callback or queue is subscribed."""
+        self._has_subscribers = bool(self._subscribers or self._subscriber_queues)
+
+    def _offer_to_queues(self, update: ResourceUpdate) -> None:
+        """Put an update on every subscriber queue without waiting."""
+        for queue, dropped in list(self._subscriber_queues.items()):
+            if dropped:
+                # Room is needed for the drop notice and the update itself
+                if queue.maxsize - queue.qsize() < 2:
+                    self._subscriber_queues[queue] = dropped + 1
+                    continue
+                queue.put_nowait(
+                    ResourceUpdate(
+                        resource_uri=self.uri,
+                        update_type=ResourceUpdateType.DROPPED,
+                        data={"dropped": dropped},
+                    )
+                )
+                self._subscriber_queues[queue] = 0
+
+            try:
+                queue.put_nowait(update)
+            except asyncio.QueueFull:
+                self._subscriber_queues[queue] = 1
+
+    def emit_update_nowait(self, update: ResourceUpdate) -> None:
+        """
+        Emit a resource update to all subscribers from synchronous code.
+
+        Callbacks are synchronous and queue subscribers are fed without
+        waiting, so event handlers on the loop thread can deliver directly
+        instead of scheduling a task per update.
+        """
+        if not self._has_subscribers:
+            return
+
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Emitting resource update",
+                resource=self.name,
+                update_type=update.update_type,
+                subscribers=len(self._subscribers) + len(self._subscriber_queues),
+            )
+
+        self._offer_to_queues(update)
+
+        for callback in self._subscribers:
             try:
                 callback(update)
             except Exception as e:
@@ -149,6 +286,30 @@ class BaseMCPResource(ABC):
                     exc_info=True,
                 )
 
+    async def emit_update(self, update: ResourceUpdate) -> None:
+        """Emit a resource update to all subscribers."""
+        self.emit_update_nowait(update)
+
+    async def _get_team_channel_ids(
+        self, http_client: "AsyncHTTPClient", team_id: str
+    ) -> List[str]:
+        """
+        Get the IDs of a team's channels, reusing a recent result.
+
+        Args:
+            http_client: Authenticated HTTP client
+            team_id: Team to list channels for
+
+        Returns:
+            Channel IDs, refetched at most every ``TEAM_CHANNELS_TTL_SECONDS``
+        """
+        now = time.monotonic()
+        if now >= self._team_channel_ids_expires:
+            channels_data = await http_client.get(f"/teams/{team_id}/channels")
+            self._team_channel_ids = [ch["id"] for ch in channels_data]
+            self._team_channel_ids_expires = now + TEAM_CHANNELS_TTL_SECONDS
+        return list(self._team_channel_ids)
+
     async def start_streaming(self, **kwargs) -> None:
         """Start streaming updates (if supported)."""
         if not self.supports_streaming():
@@ -213,53 +374,136 @@ class BaseMCPResource(ABC):
         """Override to implement streaming stop logic."""
         pass
 
+    def _is_stream_connected(self) -> bool:
+        """Override to report whether streaming currently delivers events."""
+        return False
+
     async def _polling_loop(self, interval_seconds: float, **kwargs) -> None:
         """Polling loop implementation."""
+        consecutive_errors = 0
+        streaming_interval_ns = int(
+            interval_seconds * STREAMING_POLL_INTERVAL_FACTOR * 1_000_000_000
+        )
         while True:
             try:
                 await asyncio.sleep(interval_seconds)
 
-                if not self._subscribers:
+                if not self._has_subscribers:
+                    continue
+
+                # Polling is the fallback for a missing or dropped stream; while
+                # the stream is up it only sweeps for missed events now and then
+                if (
+                    self._is_stream_connected()
+                    and self._last_poll_time_ns
+                    and time.monotonic_ns() - self._last_poll_time_ns
+                    < streaming_interval_ns
+                ):
                     continue
 
                 await self._poll_for_updates(**kwargs)
-                self._last_poll_time = datetime.utcnow()
+                self._last_poll_time_ns = time.monotonic_ns()
+                consecutive_errors = 0
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Error in polling loop", resource=self.name, error=str(e))
-                await asyncio.sleep(min(interval_seconds * 2, 300))  # Back off on error
+                consecutive_errors += 1
+                await asyncio.sleep(
+                    _backoff_delay(interval_seconds, consecutive_errors)
+                )
 
     async def _poll_for_updates(self, **kwargs) -> None:
         """Override to implement polling logic."""
         pass
 
 
+async def _run_all(awaitables: Iterable[Awaitable[Any]]) -> int:
+    """
+    Run awaitables concurrently and wait for all of them to finish.
+
+    A failure in one awaitable does not cancel the rest; cancelling the caller
+    cancels all of them.
+
+    Args:
+        awaitables: Coroutines to run
+
+    Returns:
+        Number of awaitables that raised an exception
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    return sum(1 for result in results if isinstance(result, Exception))
+
+
 class MCPResourceRegistry:
     """Registry for MCP resources."""
 
     def __init__(self):
         self._resources: Dict[str, BaseMCPResource] = {}
+        # Resource definitions and their dumps, rebuilt only when the registry
+        # changes
+        self._definitions: Optional[List[MCPResourceDefinition]] = None
+        self._definition_dicts: Optional[List[Dict[str, Any]]] = None
+        # Callbacks subscribed to every resource, including ones registered later
+        self._subscribers: List[Callable[[ResourceUpdate], None]] = []
 
     def register(self, resource: BaseMCPResource) -> None:
         """Register a resource."""
         self._resources[resource.uri] = resource
+        for callback in self._subscribers:
+            resource.subscribe(callback)
+        self._definitions = None
+        self._definition_dicts = None
         logger.info("Registered resource", uri=resource.uri, name=resource.name)
 
     def unregister(self, uri: str) -> None:
         """Unregister a resource."""
         if uri in self._resources:
             resource = self._resources.pop(uri)
+            self._definitions = None
+            self._definition_dicts = None
+            for callback in self._subscribers:
+                resource.unsubscribe(callback)
             logger.info("Unregistered resource", uri=uri, name=resource.name)
 
+    def subscribe_all(self, callback: Callable[[ResourceUpdate], None]) -> None:
+        """Subscribe a callback to updates from every registered resource."""
+        if callback in self._subscribers:
+            return
+        self._subscribers.append(callback)
+        for resource in self._resources.values():
+            resource.subscribe(callback)
+
+    def unsubscribe_all(self, callback: Callable[[ResourceUpdate], None]) -> None:
+        """Unsubscribe a callback added with subscribe_all."""
+        if callback not in self._subscribers:
+            return
+        self._subscribers.remove(callback)
+        for resource in self._resources.values():
+            resource.unsubscribe(callback)
+
     def get(self, uri: str) -> Optional[BaseMCPResource]:
         """Get a resource by URI."""
         return self._resources.get(uri)
 
     def list_resources(self) -> List[MCPResourceDefinition]:
         """List all registered resources."""
-        return [resource.get_definition() for resource in self._resources.values()]
+        if self._definitions is None:
+            self._definitions = [
+                resource.get_definition() for resource in self._resources.values()
+            ]
+        return list(self._definitions)
+
+    def list_resource_dicts(self) -> List[Dict[str, Any]]:
+        """List all registered resources serialized for the MCP protocol."""
+        if self._definition_dicts is None:
+            self._definition_dicts = [
+                definition.model_dump() for definition in self.list_resources()
+            ]
+        # Definitions are flat, so copying each dict keeps callers from
+        # modifying the cache
+        return [dict(definition) for definition in self._definition_dicts]
 
     def get_streaming_resources(self) -> List[BaseMCPResource]:
         """Get all resources that support streaming."""
@@ -280,18 +524,13 @@ class MCPResourceRegistry:
             "Starting streaming for all resources", count=len(streaming_resources)
         )
 
-        tasks = []
-        for resource in streaming_resources:
-            task = asyncio.create_task(resource.start_streaming(**kwargs))
-            tasks.append(task)
-
         # Wait for all to start, but don't fail if some fail
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        failures = [r for r in results if isinstance(r, Exception)]
+        failures = await _run_all(
+            resource.start_streaming(**kwargs) for resource in streaming_resources
+        )
         if failures:
             logger.warning(
-                "Some streaming resources failed to start", failures=len(failures)
+                "Some streaming resources failed to start", failures=failures
             )
 
     async def stop_all_streaming(self) -> None:
@@ -304,8 +543,7 @@ class MCPResourceRegistry:
             "Stopping streaming for all resources", count=len(streaming_resources)
         )
 
-        tasks = [resource.stop_streaming() for resource in streaming_resources]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await _run_all(resource.stop_streaming() for resource in streaming_resources)
 
     async def start_all_polling(self, interval_seconds: float = 30.0, **kwargs) -> None:
         """Start polling for all supported resources."""
@@ -320,21 +558,13 @@ class MCPResourceRegistry:
             interval=interval_seconds,
         )
 
-        tasks = []
-        for resource in polling_resources:
-            task = asyncio.create_task(
-                resource.start_polling(interval_seconds, **kwargs)
-            )
-            tasks.append(task)
-
         # Wait for all to start, but don't fail if some fail
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        failures = [r for r in results if isinstance(r, Exception)]
+        failures = await _run_all(
+            resource.start_polling(interval_seconds, **kwargs)
+            for resource in polling_resources
+        )
         if failures:
-            logger.warning(
-                "Some polling resources failed to start", failures=len(failures)
-            )
+            logger.warning("Some polling resources failed to start", failures=failures)
 
     async def stop_all_polling(self) -> None:
         """Stop polling for all resources."""
@@ -344,8 +574,7 @@ class MCPResourceRegistry:
 
         logger.info("Stopping polling for all resources", count=len(polling_resources))
 
-        tasks = [resource.stop_polling() for resource in polling_resources]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await _run_all(resource.stop_polling() for resource in polling_resources)
 
     async def cleanup(self) -> None:
         """Cleanup all resources."""
@@ -3,11 +3,18 @@ Streaming resource for new channel posts in Mattermost.
 
 This resource provides real-time updates for new posts in channels,
 supporting both WebSocket streaming and REST polling.
+
+Posts are passed through as the raw Mattermost JSON dicts; consumers that need
+typed access can validate them with ``Post.model_validate``.
 """
 
 import asyncio
+import heapq
+import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import structlog
 
@@ -15,11 +22,16 @@ from ..api.client import AsyncHTTPClient
 from ..api.exceptions import MattermostAPIError
 from ..auth import get_auth_state
 from ..events.websocket import MattermostWebSocketClient
-from ..models.posts import Post
 from .base import BaseMCPResource, ResourceUpdate, ResourceUpdateType
 
 logger = structlog.get_logger(__name__)
 
+# Number of recently streamed post IDs remembered to drop replayed events
+RECENT_POST_IDS_SIZE = 4096
+
+# Upper bound on concurrent per-channel post requests
+MAX_CONCURRENT_CHANNEL_FETCHES = 16
+
 
 class NewChannelPostResource(BaseMCPResource):
     """Resource for streaming new channel posts."""
@@ -42,18 +54,24 @@ class NewChannelPostResource(BaseMCPResource):
             mime_type="application/json",
         )
 
-        self.channel_ids = set(channel_ids) if channel_ids else None
+        self.channel_ids: Optional[FrozenSet[str]] = (
+            frozenset(channel_ids) if channel_ids else None
+        )
         self.team_id = team_id
 
         # WebSocket client for streaming
         self._ws_client: Optional[MattermostWebSocketClient] = None
 
-        # HTTP client for polling
-        self._http_client: Optional[AsyncHTTPClient] = None
-
         # State tracking for polling
         self._last_post_times: Dict[str, int] = {}  # channel_id -> timestamp
 
+        # Bounds per-channel fetches; created on first use so it binds to the
+        # running event loop on Python < 3.10
+        self._poll_sem: Optional[asyncio.Semaphore] = None
+
+        # Recently streamed post IDs, oldest first, for dropping replayed events
+        self._recent_post_ids: "OrderedDict[str, None]" = OrderedDict()
+
         logger.info(
             "Initialized new channel post resource",
             channels=len(channel_ids) if channel_ids else "all",
@@ -85,35 +103,38 @@ class NewChannelPostResource(BaseMCPResource):
                 channels_to_read = list(self.channel_ids)
             elif self.team_id:
                 # Get all channels for the team
-                channels_data = await http_client.get(f"/teams/{self.team_id}/channels")
-                channels_to_read = [ch["id"] for ch in channels_data]
-
-            # Get recent posts from each channel
-            recent_posts = []
-            for channel_id in channels_to_read:
-                try:
-                    posts_data = await http_client.get(
-                        f"/channels/{channel_id}/posts", params={"per_page": 10}
-                    )
+                channels_to_read = await self._get_team_channel_ids(
+                    http_client, self.team_id
+                )
 
-                    if "posts" in posts_data:
-                        for post_data in posts_data["posts"].values():
-                            post = Post(**post_data)
-                            recent_posts.append(post.model_dump())
+            # Get recent posts from all channels concurrently
+            results = await asyncio.gather(
+                *(
+                    self._read_channel_posts(http_client, channel_id)
+                    for channel_id in channels_to_read
+                ),
+                return_exceptions=True,
+            )
 
-                except Exception as e:
+            recent_posts = []
+            for channel_id, result in zip(channels_to_read, results):
+                if isinstance(result, BaseException):
                     logger.warning(
                         "Failed to get posts for channel",
                         channel_id=channel_id,
-                        error=str(e),
+                        error=str(result),
                     )
+                    continue
+                recent_posts.extend(result)
 
-            # Sort by creation time
-            recent_posts.sort(key=lambda p: p.get("create_at", 0), reverse=True)
+            # Keep the 50 most recent without sorting every channel's posts
+            recent_posts = heapq.nlargest(
+                50, recent_posts, key=lambda p: p.get("create_at") or 0
+            )
 
             return {
                 "resource_uri": self.uri,
-                "posts": recent_posts[:50],  # Limit to 50 most recent
+                "posts": recent_posts,
                 "timestamp": datetime.utcnow().isoformat(),
                 "channels_monitored": len(channels_to_read),
             }
@@ -126,6 +147,25 @@ class NewChannelPostResource(BaseMCPResource):
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
+    def _get_poll_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent per-channel requests."""
+        if self._poll_sem is None:
+            self._poll_sem = asyncio.Semaphore(MAX_CONCURRENT_CHANNEL_FETCHES)
+        return self._poll_sem
+
+    async def _read_channel_posts(
+        self, http_client: AsyncHTTPClient, channel_id: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch the most recent posts for a single channel."""
+        async with self._get_poll_semaphore():
+            posts_data = await http_client.get(
+                f"/channels/{channel_id}/posts", params={"per_page": 10}
+            )
+
+        if "posts" not in posts_data:
+            return []
+        return list(posts_data["posts"].values())
+
     async def _start_streaming(self, **kwargs) -> None:
         """Start WebSocket streaming for new posts."""
         logger.info("Starting WebSocket streaming for new channel posts")
@@ -144,17 +184,15 @@ class NewChannelPostResource(BaseMCPResource):
         await self._ws_client.connect()
 
         # Wait for connection to be established
-        max_wait = 10.0
-        wait_time = 0.0
-        while not self._ws_client.is_connected and wait_time < max_wait:
-            await asyncio.sleep(0.1)
-            wait_time += 0.1
-
-        if not self._ws_client.is_connected:
+        if not await self._ws_client.wait_until_connected(timeout=10.0):
             raise RuntimeError("Failed to establish WebSocket connection")
 
         logger.info("WebSocket streaming started for new channel posts")
 
+    def _is_stream_connected(self) -> bool:
+        """Report whether the WebSocket is connected and authenticated."""
+        return self._ws_client is not None and self._ws_client.is_connected
+
     async def _stop_streaming(self) -> None:
         """Stop WebSocket streaming."""
         if self._ws_client:
@@ -162,8 +200,24 @@ class NewChannelPostResource(BaseMCPResource):
             self._ws_client = None
         logger.info("WebSocket streaming stopped for new channel posts")
 
+    def _is_duplicate_post(self, post_id: Optional[str]) -> bool:
+        """Record a streamed post ID and report whether it was seen recently."""
+        if not post_id:
+            return False
+        if post_id in self._recent_post_ids:
+            return True
+
+        self._recent_post_ids[post_id] = None
+        if len(self._recent_post_ids) > RECENT_POST_IDS_SIZE:
+            self._recent_post_ids.popitem(last=False)
+        return False
+
     def _handle_new_post_event(self, event_data: Dict[str, Any]) -> None:
         """Handle new post WebSocket event."""
+        # Nobody to deliver to; skip building the update
+        if not self._has_subscribers:
+            return
+
         try:
             post_data = event_data.get("data", {})
             broadcast = event_data.get("broadcast", {})
@@ -174,30 +228,32 @@ class NewChannelPostResource(BaseMCPResource):
             if self.channel_ids and channel_id not in self.channel_ids:
                 return
 
-            # Create post object
-            post = Post(**post_data)
+            # Skip events replayed after a reconnect
+            if self._is_duplicate_post(post_data.get("id")):
+                return
 
             # Create resource update
             update = ResourceUpdate(
                 resource_uri=self.uri,
                 update_type=ResourceUpdateType.CREATED,
                 data={
-                    "post": post.model_dump(),
+                    "post": post_data,
                     "channel_id": channel_id,
-                    "user_id": post.user_id,
+                    "user_id": post_data.get("user_id"),
                 },
-                event_id=f"post_{post.id}",
+                event_id=f"post_{post_data.get('id')}",
             )
 
-            # Emit the update (async call from sync handler)
-            asyncio.create_task(self.emit_update(update))
+            # Deliver directly; no task is needed from a sync handler
+            self.emit_update_nowait(update)
 
-            logger.debug(
-                "New post event processed",
-                post_id=post.id,
-                channel_id=channel_id,
-                user_id=post.user_id,
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "New post event processed",
+                    post_id=post_data.get("id"),
+                    channel_id=channel_id,
+                    user_id=post_data.get("user_id"),
+                )
 
         except Exception as e:
             logger.error("Error handling new post event", error=str(e), exc_info=True)
@@ -224,12 +280,26 @@ class NewChannelPostResource(BaseMCPResource):
                 channels_to_poll = list(self.channel_ids)
             elif self.team_id:
                 # Get all channels for the team
-                channels_data = await http_client.get(f"/teams/{self.team_id}/channels")
-                channels_to_poll = [ch["id"] for ch in channels_data]
+                channels_to_poll = await self._get_team_channel_ids(
+                    http_client, self.team_id
+                )
 
-            # Poll each channel for new posts
-            for channel_id in channels_to_poll:
-                await self._poll_channel_posts(channel_id)
+            # Poll all channels concurrently; one failing channel must not
+            # abort the rest of the batch
+            results = await asyncio.gather(
+                *(
+                    self._poll_channel_posts(channel_id)
+                    for channel_id in channels_to_poll
+                ),
+                return_exceptions=True,
+            )
+            for channel_id, result in zip(channels_to_poll, results):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "Error polling channel for posts",
+                        channel_id=channel_id,
+                        error=str(result),
+                    )
 
         except Exception as e:
             logger.error("Error polling for new posts", error=str(e))
@@ -246,49 +316,51 @@ class NewChannelPostResource(BaseMCPResource):
             if not http_client:
                 return
 
-            posts_data = await http_client.get(
-                f"/channels/{channel_id}/posts",
-                params={"per_page": 20, "since": since_timestamp},
-            )
+            async with self._get_poll_semaphore():
+                posts_data = await http_client.get(
+                    f"/channels/{channel_id}/posts",
+                    params={"per_page": 20, "since": since_timestamp},
+                )
 
             if "posts" not in posts_data:
                 return
 
-            # Process new posts
-            new_posts = []
-            latest_timestamp = since_timestamp
-
-            for post_data in posts_data["posts"].values():
-                post = Post(**post_data)
-
-                # Only include posts newer than our last timestamp
-                if post.create_at and post.create_at > since_timestamp:
-                    new_posts.append(post)
-                    latest_timestamp = max(latest_timestamp, post.create_at)
+            # Only include posts newer than our last timestamp, oldest first
+            new_posts = sorted(
+                (
+                    post_data
+                    for post_data in posts_data["posts"].values()
+                    if (post_data.get("create_at") or 0) > since_timestamp
+                ),
+                key=itemgetter("create_at"),
+            )
 
-            # Update last timestamp
-            if latest_timestamp > since_timestamp:
-                self._last_post_times[channel_id] = latest_timestamp
+            # Update last timestamp; the request awaited, so only move forward
+            # in case an overlapping poll of this channel already advanced it
+            if new_posts:
+                latest_timestamp = new_posts[-1]["create_at"]
+                if latest_timestamp > self._last_post_times.get(channel_id, 0):
+                    self._last_post_times[channel_id] = latest_timestamp
 
-            # Sort by creation time (oldest first)
-            new_posts.sort(key=lambda p: p.create_at or 0)
+            # Emit updates for new posts not already delivered by the stream
+            for post_data in new_posts:
+                if self._is_duplicate_post(post_data.get("id")):
+                    continue
 
-            # Emit updates for new posts
-            for post in new_posts:
                 update = ResourceUpdate(
                     resource_uri=self.uri,
                     update_type=ResourceUpdateType.CREATED,
                     data={
-                        "post": post.model_dump(),
+                        "post": post_data,
                         "channel_id": channel_id,
-                        "user_id": post.user_id,
+                        "user_id": post_data.get("user_id"),
                     },
-                    event_id=f"post_{post.id}",
+                    event_id=f"post_{post_data.get('id')}",
                 )
 
-                await self.emit_update(update)
+                self.emit_update_nowait(update)
 
-            if new_posts:
+            if new_posts and logger.is_enabled_for(logging.DEBUG):
                 logger.debug(
                     "Found new posts in polling",
                     channel_id=channel_id,
@@ -6,8 +6,11 @@ supporting both WebSocket streaming and REST polling.
 """
 
 import asyncio
+import heapq
+import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import structlog
 
@@ -19,6 +22,15 @@ from .base import BaseMCPResource, ResourceUpdate, ResourceUpdateType
 
 logger = structlog.get_logger(__name__)
 
+# Upper bound on concurrent post and reaction requests
+MAX_CONCURRENT_REACTION_FETCHES = 32
+
+# Identifies a reaction as (post_id, user_id, emoji_name)
+ReactionKey = Tuple[str, str, str]
+
+# A post's update_at and the reactions seen on it at that version
+PostReactions = Tuple[int, List[Dict[str, Any]]]
+
 
 class ReactionResource(BaseMCPResource):
     """Resource for streaming reaction events."""
@@ -41,18 +53,24 @@ class ReactionResource(BaseMCPResource):
             mime_type="application/json",
         )
 
-        self.channel_ids = set(channel_ids) if channel_ids else None
+        self.channel_ids: Optional[FrozenSet[str]] = (
+            frozenset(channel_ids) if channel_ids else None
+        )
         self.team_id = team_id
 
         # WebSocket client for streaming
         self._ws_client: Optional[MattermostWebSocketClient] = None
 
-        # HTTP client for polling
-        self._http_client: Optional[AsyncHTTPClient] = None
-
         # State tracking for polling
-        self._known_reactions: Set[str] = set()  # post_id:user_id:emoji_name
-        self._last_poll_time: Optional[datetime] = None
+        self._known_reactions: Set[ReactionKey] = set()
+
+        # Reactions seen on each channel's recent posts, keyed by post ID, so
+        # polls only re-fetch reactions for posts whose update_at has moved
+        self._post_reactions: Dict[str, Dict[str, PostReactions]] = {}
+
+        # Bounds post and reaction fetches; created on first use so it binds to
+        # the running event loop on Python < 3.10
+        self._fetch_sem: Optional[asyncio.Semaphore] = None
 
         logger.info(
             "Initialized reaction resource",
@@ -88,62 +106,48 @@ class ReactionResource(BaseMCPResource):
                 channels_to_read = list(self.channel_ids)
             elif self.team_id:
                 # Get all channels for the team
-                channels_data = await http_client.get(f"/teams/{self.team_id}/channels")
-                channels_to_read = [ch["id"] for ch in channels_data]
-
-            # Get recent posts and their reactions
-            for channel_id in channels_to_read:
-                try:
-                    posts_data = await http_client.get(
-                        f"/channels/{channel_id}/posts", params={"per_page": 20}
-                    )
-
-                    if "posts" not in posts_data:
-                        continue
-
-                    # Check each post for reactions
-                    for post_data in posts_data["posts"].values():
-                        post_id = post_data.get("id")
-                        if not post_id:
-                            continue
-
-                        # Get reactions for this post
-                        try:
-                            reactions_data = await http_client.get(
-                                f"/posts/{post_id}/reactions"
-                            )
+                channels_to_read = await self._get_team_channel_ids(
+                    http_client, self.team_id
+                )
 
-                            for reaction in reactions_data:
-                                recent_reactions.append(
-                                    {
-                                        "post_id": post_id,
-                                        "user_id": reaction.get("user_id"),
-                                        "emoji_name": reaction.get("emoji_name"),
-                                        "create_at": reaction.get("create_at"),
-                                        "channel_id": channel_id,
-                                    }
-                                )
-
-                        except Exception as e:
-                            logger.debug(
-                                "Failed to get reactions for post",
-                                post_id=post_id,
-                                error=str(e),
-                            )
+            # Get recent posts and their reactions from all channels concurrently
+            results = await asyncio.gather(
+                *(
+                    self._fetch_channel_reactions(http_client, channel_id, 20)
+                    for channel_id in channels_to_read
+                ),
+                return_exceptions=True,
+            )
 
-                except Exception as e:
+            for channel_id, result in zip(channels_to_read, results):
+                if isinstance(result, BaseException):
                     logger.warning(
                         "Failed to get posts for channel",
                         channel_id=channel_id,
-                        error=str(e),
+                        error=str(result),
                     )
+                    continue
 
-            # Sort by creation time
-            recent_reactions.sort(key=lambda r: r.get("create_at", 0), reverse=True)
+                for post_id, reactions_data in result:
+                    for reaction in reactions_data:
+                        recent_reactions.append(
+                            {
+                                "post_id": post_id,
+                                "user_id": reaction.get("user_id"),
+                                "emoji_name": reaction.get("emoji_name"),
+                                "create_at": reaction.get("create_at"),
+                                "channel_id": channel_id,
+                            }
+                        )
+
+            # Keep the 100 most recent without sorting every reaction
+            recent_reactions = heapq.nlargest(
+                100, recent_reactions, key=lambda r: r.get("create_at") or 0
+            )
 
             return {
                 "resource_uri": self.uri,
-                "reactions": recent_reactions[:100],  # Limit to 100 most recent
+                "reactions": recent_reactions,
                 "timestamp": datetime.utcnow().isoformat(),
                 "channels_monitored": len(channels_to_read),
             }
@@ -156,6 +160,76 @@ class ReactionResource(BaseMCPResource):
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
+    def _get_fetch_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent post and reaction requests."""
+        if self._fetch_sem is None:
+            self._fetch_sem = asyncio.Semaphore(MAX_CONCURRENT_REACTION_FETCHES)
+        return self._fetch_sem
+
+    async def _fetch_channel_reactions(
+        self,
+        http_client: AsyncHTTPClient,
+        channel_id: str,
+        per_page: int,
+        use_cache: bool = False,
+    ) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Fetch recent posts in a channel and the reactions on each of them.
+
+        Reactions for all posts come from a single bulk request. Adding or
+        removing a reaction bumps the post's update_at, so with ``use_cache``
+        posts whose update_at matches the previous fetch reuse the reactions
+        seen then and are left out of the bulk request.
+
+        Args:
+            http_client: Authenticated HTTP client
+            channel_id: Channel to read posts from
+            per_page: Number of recent posts to check
+            use_cache: Reuse reactions for posts unchanged since the last fetch
+
+        Returns:
+            (post_id, reactions) pairs for the posts that have reactions
+        """
+        async with self._get_fetch_semaphore():
+            posts_data = await http_client.get(
+                f"/channels/{channel_id}/posts", params={"per_page": per_page}
+            )
+
+        posts = posts_data.get("posts") or {}
+        cached = self._post_reactions.get(channel_id, {}) if use_cache else {}
+        channel_cache: Dict[str, PostReactions] = {}
+        stale_ids = []
+
+        for post_id, post in posts.items():
+            if not post_id:
+                continue
+            update_at = post.get("update_at") or 0
+            hit = cached.get(post_id)
+            if update_at and hit is not None and hit[0] == update_at:
+                channel_cache[post_id] = hit
+            else:
+                channel_cache[post_id] = (update_at, [])
+                stale_ids.append(post_id)
+
+        if stale_ids:
+            async with self._get_fetch_semaphore():
+                reactions_map = await http_client.post(
+                    "/posts/ids/reactions", json=stale_ids
+                )
+
+            for post_id, reactions in (reactions_map or {}).items():
+                if post_id in channel_cache and reactions:
+                    channel_cache[post_id] = (channel_cache[post_id][0], reactions)
+
+        if use_cache:
+            self._post_reactions[channel_id] = channel_cache
+
+        return [
+            (post_id, reactions)
+            for post_id, (_, reactions) in channel_cache.items()
+            if reactions
+        ]
+
     async def _start_streaming(self, **kwargs) -> None:
         """Start WebSocket streaming for reaction events."""
         auth_state = get_auth_state()
@@ -177,17 +251,15 @@ class ReactionResource(BaseMCPResource):
         await self._ws_client.connect()
 
         # Wait for connection to be established
-        max_wait = 10.0
-        wait_time = 0.0
-        while not self._ws_client.is_connected and wait_time < max_wait:
-            await asyncio.sleep(0.1)
-            wait_time += 0.1
-
-        if not self._ws_client.is_connected:
+        if not await self._ws_client.wait_until_connected(timeout=10.0):
             raise RuntimeError("Failed to establish WebSocket connection")
 
         logger.info("WebSocket streaming started for reactions")
 
+    def _is_stream_connected(self) -> bool:
+        """Report whether the WebSocket is connected and authenticated."""
+        return self._ws_client is not None and self._ws_client.is_connected
+
     async def _stop_streaming(self) -> None:
         """Stop WebSocket streaming."""
         if self._ws_client:
@@ -197,6 +269,10 @@ class ReactionResource(BaseMCPResource):
 
     def _handle_reaction_added_event(self, event_data: Dict[str, Any]) -> None:
         """Handle reaction added WebSocket event."""
+        # Nobody to deliver to; skip building the update
+        if not self._has_subscribers:
+            return
+
         try:
             reaction_data = event_data.get("data", {})
             broadcast = event_data.get("broadcast", {})
@@ -207,6 +283,10 @@ class ReactionResource(BaseMCPResource):
             if self.channel_ids and channel_id not in self.channel_ids:
                 return
 
+            post_id = reaction_data.get("post_id")
+            user_id = reaction_data.get("user_id")
+            emoji_name = reaction_data.get("emoji_name")
+
             # Create resource update
             update = ResourceUpdate(
                 resource_uri=self.uri,
@@ -214,25 +294,34 @@ class ReactionResource(BaseMCPResource):
                 data={
                     "reaction": reaction_data,
                     "channel_id": channel_id,
-                    "post_id": reaction_data.get("post_id"),
-                    "user_id": reaction_data.get("user_id"),
-                    "emoji_name": reaction_data.get("emoji_name"),
+                    "post_id": post_id,
+                    "user_id": user_id,
+                    "emoji_name": emoji_name,
                 },
-                event_id=(
-                    f"reaction_{reaction_data.get('post_id')}_"
-                    f"{reaction_data.get('user_id')}_{reaction_data.get('emoji_name')}"
-                ),
+                event_id=f"reaction_{post_id}_{user_id}_{emoji_name}",
             )
 
-            # Emit the update (async call from sync handler)
-            asyncio.create_task(self.emit_update(update))
-
-            logger.debug(
-                "Reaction added event processed",
-                post_id=reaction_data.get("post_id"),
-                emoji_name=reaction_data.get("emoji_name"),
-                user_id=reaction_data.get("user_id"),
-            )
+            # Deliver directly; no task is needed from a sync handler
+            self.emit_update_nowait(update)
+
+            # Keep the polling baseline current so a fallback poll after a
+            # disconnect does not report this reaction again. Only posts in
+            # the polled window are tracked, which keeps the set bounded
+            # while polling is paused.
+            if (
+                user_id
+                and emoji_name
+                and post_id in self._post_reactions.get(channel_id, {})
+            ):
+                self._known_reactions.add((post_id, user_id, emoji_name))
+
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Reaction added event processed",
+                    post_id=post_id,
+                    emoji_name=emoji_name,
+                    user_id=user_id,
+                )
 
         except Exception as e:
             logger.error(
@@ -241,6 +330,10 @@ class ReactionResource(BaseMCPResource):
 
     def _handle_reaction_removed_event(self, event_data: Dict[str, Any]) -> None:
         """Handle reaction removed WebSocket event."""
+        # Nobody to deliver to; skip building the update
+        if not self._has_subscribers:
+            return
+
         try:
             reaction_data = event_data.get("data", {})
             broadcast = event_data.get("broadcast", {})
@@ -251,6 +344,10 @@ class ReactionResource(BaseMCPResource):
             if self.channel_ids and channel_id not in self.channel_ids:
                 return
 
+            post_id = reaction_data.get("post_id")
+            user_id = reaction_data.get("user_id")
+            emoji_name = reaction_data.get("emoji_name")
+
             # Create resource update
             update = ResourceUpdate(
                 resource_uri=self.uri,
@@ -258,25 +355,25 @@ class ReactionResource(BaseMCPResource):
                 data={
                     "reaction": reaction_data,
                     "channel_id": channel_id,
-                    "post_id": reaction_data.get("post_id"),
-                    "user_id": reaction_data.get("user_id"),
-                    "emoji_name": reaction_data.get("emoji_name"),
+                    "post_id": post_id,
+                    "user_id": user_id,
+                    "emoji_name": emoji_name,
                 },
-                event_id=(
-                    f"reaction_removed_{reaction_data.get('post_id')}_"
-                    f"{reaction_data.get('user_id')}_{reaction_data.get('emoji_name')}"
-                ),
+                event_id=f"reaction_removed_{post_id}_{user_id}_{emoji_name}",
             )
 
-            # Emit the update (async call from sync handler)
-            asyncio.create_task(self.emit_update(update))
+            # Deliver directly; no task is needed from a sync handler
+            self.emit_update_nowait(update)
 
-            logger.debug(
-                "Reaction removed event processed",
-                post_id=reaction_data.get("post_id"),
-                emoji_name=reaction_data.get("emoji_name"),
-                user_id=reaction_data.get("user_id"),
-            )
+            self._known_reactions.discard((post_id, user_id, emoji_name))
+
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Reaction removed event processed",
+                    post_id=post_id,
+                    emoji_name=emoji_name,
+                    user_id=user_id,
+                )
 
         except Exception as e:
             logger.error(
@@ -285,17 +382,17 @@ class ReactionResource(BaseMCPResource):
 
     async def _poll_for_updates(self, **kwargs) -> None:
         """Poll for reaction changes using REST API."""
-        auth_state = get_auth_state()
-        if not self._http_client:
-            self._http_client = auth_state.get_http_client()
-            if not self._http_client:
-                logger.warning("No authenticated HTTP client available for polling")
-                return
+        # Use the auth state's pooled client every cycle; a cached reference
+        # would be left closed after re-authentication
+        http_client = get_auth_state().get_http_client()
+        if not http_client:
+            logger.warning("No authenticated HTTP client available for polling")
+            return
 
         logger.debug("Polling for reaction updates")
 
         try:
-            current_reactions: set[str] = set()
+            current_reactions: Set[ReactionKey] = set()
 
             # Get channels to poll
             channels_to_poll = []
@@ -304,21 +401,40 @@ class ReactionResource(BaseMCPResource):
                 channels_to_poll = list(self.channel_ids)
             elif self.team_id:
                 # Get all channels for the team
-                channels_data = await self._http_client.get(
-                    f"/teams/{self.team_id}/channels"
+                channels_to_poll = await self._get_team_channel_ids(
+                    http_client, self.team_id
                 )
-                channels_to_poll = [ch["id"] for ch in channels_data]
 
-            # Poll each channel for posts and their reactions
-            for channel_id in channels_to_poll:
-                await self._poll_channel_reactions(channel_id, current_reactions)
+            # Poll all channels concurrently for posts and their reactions
+            polled = await asyncio.gather(
+                *(
+                    self._poll_channel_reactions(
+                        http_client, channel_id, current_reactions
+                    )
+                    for channel_id in channels_to_poll
+                )
+            )
 
-            # Detect removed reactions (reactions that were there before but not now)
-            if self._last_poll_time:  # Only check after first poll
+            # A channel that failed to fetch reports no reactions; carry over
+            # what was known for its posts instead of reporting them removed
+            for channel_id, ok in zip(channels_to_poll, polled):
+                if ok:
+                    continue
+                failed_posts = self._post_reactions.get(channel_id, {})
+                current_reactions.update(
+                    key for key in self._known_reactions if key[0] in failed_posts
+                )
+
+            # Forget cached posts of channels that are no longer polled
+            for channel_id in self._post_reactions.keys() - set(channels_to_poll):
+                del self._post_reactions[channel_id]
+
+            # Detect removed reactions (reactions that were there before but not
+            # now); only after the first poll, and only if any were known
+            if self._last_poll_time_ns and self._known_reactions:
                 removed_reactions = self._known_reactions - current_reactions
 
-                for reaction_key in removed_reactions:
-                    post_id, user_id, emoji_name = reaction_key.split(":", 2)
+                for post_id, user_id, emoji_name in removed_reactions:
 
                     update = ResourceUpdate(
                         resource_uri=self.uri,
@@ -331,71 +447,62 @@ class ReactionResource(BaseMCPResource):
                         event_id=f"reaction_removed_{post_id}_{user_id}_{emoji_name}",
                     )
 
-                    await self.emit_update(update)
+                    self.emit_update_nowait(update)
 
             # Update known reactions
             self._known_reactions = current_reactions
-            self._last_poll_time = datetime.utcnow()
+            self._last_poll_time_ns = time.monotonic_ns()
 
         except Exception as e:
             logger.error("Error polling for reaction updates", error=str(e))
 
     async def _poll_channel_reactions(
-        self, channel_id: str, current_reactions: Set[str]
-    ) -> None:
-        """Poll a specific channel for reaction changes."""
+        self,
+        http_client: AsyncHTTPClient,
+        channel_id: str,
+        current_reactions: Set[ReactionKey],
+    ) -> bool:
+        """
+        Poll a specific channel for reaction changes.
+
+        Returns:
+            True if the channel's posts and reactions were fetched
+        """
         try:
-            # Get recent posts
-            if not self._http_client:
-                return
-            posts_data = await self._http_client.get(
-                f"/channels/{channel_id}/posts",
-                params={"per_page": 50},  # Check more posts for reactions
+            # Check more posts for reactions than read() does
+            post_reactions = await self._fetch_channel_reactions(
+                http_client, channel_id, 50, use_cache=True
             )
 
-            if "posts" not in posts_data:
-                return
-
-            # Check reactions on each post
-            for post_data in posts_data["posts"].values():
-                post_id = post_data.get("id")
-                if not post_id:
-                    continue
+            for post_id, reactions_data in post_reactions:
+                for reaction in reactions_data:
+                    user_id = reaction.get("user_id")
+                    emoji_name = reaction.get("emoji_name")
 
-                try:
-                    if not self._http_client:
+                    if not user_id or not emoji_name:
                         continue
-                    reactions_data = await self._http_client.get(
-                        f"/posts/{post_id}/reactions"
-                    )
-
-                    for reaction in reactions_data:
-                        user_id = reaction.get("user_id")
-                        emoji_name = reaction.get("emoji_name")
-
-                        if not user_id or not emoji_name:
-                            continue
-
-                        reaction_key = f"{post_id}:{user_id}:{emoji_name}"
-                        current_reactions.add(reaction_key)
-
-                        # Check if this is a new reaction
-                        if reaction_key not in self._known_reactions:
-                            update = ResourceUpdate(
-                                resource_uri=self.uri,
-                                update_type=ResourceUpdateType.REACTION_ADDED,
-                                data={
-                                    "reaction": reaction,
-                                    "channel_id": channel_id,
-                                    "post_id": post_id,
-                                    "user_id": user_id,
-                                    "emoji_name": emoji_name,
-                                },
-                                event_id=f"reaction_{post_id}_{user_id}_{emoji_name}",
-                            )
-
-                            await self.emit_update(update)
 
+                    reaction_key = (post_id, user_id, emoji_name)
+                    current_reactions.add(reaction_key)
+
+                    # Check if this is a new reaction
+                    if reaction_key not in self._known_reactions:
+                        update = ResourceUpdate(
+                            resource_uri=self.uri,
+                            update_type=ResourceUpdateType.REACTION_ADDED,
+                            data={
+                                "reaction": reaction,
+                                "channel_id": channel_id,
+                                "post_id": post_id,
+                                "user_id": user_id,
+                                "emoji_name": emoji_name,
+                            },
+                            event_id=f"reaction_{post_id}_{user_id}_{emoji_name}",
+                        )
+
+                        self.emit_update_nowait(update)
+
+                        if logger.is_enabled_for(logging.DEBUG):
                             logger.debug(
                                 "Found new reaction in polling",
                                 post_id=post_id,
@@ -403,16 +510,12 @@ class ReactionResource(BaseMCPResource):
                                 user_id=user_id,
                             )
 
-                except Exception as e:
-                    logger.debug(
-                        "Failed to get reactions for post",
-                        post_id=post_id,
-                        error=str(e),
-                    )
-
         except Exception as e:
             logger.warning(
                 "Error polling channel for reactions",
                 channel_id=channel_id,
                 error=str(e),
             )
+            return False
+
+        return True
@@ -3,7 +3,9 @@ MCP Server implementation for Mattermost integration.
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional
+import logging
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -19,6 +21,12 @@ from .resources import (
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _resource_type(resource_uri: str) -> str:
+    """Return the metrics label for a resource URI (its last path segment)."""
+    return resource_uri.rsplit("/", 1)[-1]
+
+
 class MattermostMCPServer:
     """
     Main MCP server class for Mattermost integration.
@@ -106,8 +114,7 @@ class MattermostMCPServer:
         self.resource_registry.register(reactions_resource)
 
         # Subscribe to resource updates
-        for resource in self.resource_registry._resources.values():
-            resource.subscribe(self._handle_resource_update)
+        self.resource_registry.subscribe_all(self._handle_resource_update)
 
     def set_resource_update_callback(
         self, callback: Callable[[ResourceUpdate], None]
@@ -118,20 +125,18 @@ class MattermostMCPServer:
 
     def _handle_resource_update(self, update: ResourceUpdate) -> None:
         """Handle resource updates with metrics tracking."""
-        logger.debug(
-            "Resource update received",
-            resource_uri=update.resource_uri,
-            update_type=update.update_type,
-            event_id=update.event_id,
-        )
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Resource update received",
+                resource_uri=update.resource_uri,
+                update_type=update.update_type,
+                event_id=update.event_id,
+            )
 
-        # Record resource update metrics
-        resource_type = (
-            update.resource_uri.split("/")[-1]
-            if "/" in update.resource_uri
-            else update.resource_uri
+        # Record resource update metrics; the label is derived once per URI
+        metrics.record_resource_update(
+            _resource_type(update.resource_uri), update.update_type
         )
-        metrics.record_resource_update(resource_type, update.update_type)
 
         if self._resource_update_callback:
             try:
@@ -160,23 +165,29 @@ class MattermostMCPServer:
             if self.enable_streaming:
                 await self._initialize_websocket_client()
 
-            # Start resource streaming if enabled
+            # Start resource streaming and polling concurrently; they are
+            # independent of each other
+            transports: List[Tuple[str, Awaitable[None]]] = []
             if self.enable_streaming:
-                try:
-                    await self._start_streaming()
-                except Exception as e:
-                    logger.error("Failed to start streaming", error=str(e))
-                    if not self.enable_polling:
-                        raise
-
-            # Start resource polling if enabled
+                transports.append(("streaming", self._start_streaming()))
             if self.enable_polling:
-                try:
-                    await self._start_polling()
-                except Exception as e:
-                    logger.error("Failed to start polling", error=str(e))
-                    if not self.enable_streaming:
-                        raise
+                transports.append(("polling", self._start_polling()))
+
+            results = await asyncio.gather(
+                *(start for _, start in transports), return_exceptions=True
+            )
+            for (transport, _), result in zip(transports, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Failed to start transport",
+                        transport=transport,
+                        error=str(result),
+                    )
+                    # Only fatal when there is no other transport to fall back on
+                    if len(transports) == 1:
+                        raise result
+                elif isinstance(result, BaseException):
+                    raise result
 
             self._is_running = True
             logger.info("Mattermost MCP server started successfully")
@@ -236,10 +247,7 @@ class MattermostMCPServer:
         Returns:
             List of resource definitions
         """
-        return [
-            resource.model_dump()
-            for resource in self.resource_registry.list_resources()
-        ]
+        return self.resource_registry.list_resource_dicts()
 
     async def read_resource(self, uri: str, **kwargs) -> Dict[str, Any]:
         """
@@ -291,10 +299,8 @@ class MattermostMCPServer:
         # Connect to WebSocket
         await self.websocket_client.connect()
 
-        # Wait a moment to ensure connection is established
-        await asyncio.sleep(1.0)
-
-        if not self.websocket_client.is_connected:
+        # Wait for authentication to complete rather than a fixed delay
+        if not await self.websocket_client.wait_until_connected(timeout=10.0):
             # Update connection metrics
             metrics.set_active_connections(0)
             raise RuntimeError("Failed to establish WebSocket connection")
@@ -341,15 +347,17 @@ class MattermostMCPServer:
 
         logger.info("Cancelling startup tasks", count=len(self._startup_tasks))
 
-        for task in self._startup_tasks:
-            if not task.done():
-                task.cancel()
+        # Startup awaits its own tasks, so usually all of them are already done
+        pending = [task for task in self._startup_tasks if not task.done()]
+        self._startup_tasks.clear()
+
+        for task in pending:
+            task.cancel()
 
         # Wait for tasks to complete cancellation
-        if self._startup_tasks:
-            await asyncio.gather(*self._startup_tasks, return_exceptions=True)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        self._startup_tasks.clear()
         logger.info("Startup tasks cancelled")
 
     async def _cleanup_on_failure(self) -> None:
@@ -5,9 +5,12 @@ This module provides a common base class with HTTP client functionality
 that all domain service classes inherit from.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 
 import structlog
+from pydantic import TypeAdapter
 
 from ..api.client import AsyncHTTPClient
 from ..api.exceptions import AuthenticationError, HTTPError, RateLimitError
@@ -18,6 +21,88 @@ logger = structlog.get_logger(__name__)
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def _shape_adapter(response_model: Any) -> TypeAdapter:
+    """Return a cached validator for a response shape such as ``List[Model]``."""
+    return TypeAdapter(response_model)
+
+
+def _list_adapter(item_model: Any) -> TypeAdapter:
+    """Return a cached list validator for the given item model."""
+    return _shape_adapter(List[item_model])  # type: ignore[valid-type]
+
+
+def _identity(data: Any) -> Any:
+    """Return response data unchanged."""
+    return data
+
+
+@lru_cache(maxsize=None)
+def _json_parser(response_model: Any) -> Optional[Callable[[bytes], Any]]:
+    """
+    Return a parser validating a raw JSON body in one pass, if the model allows.
+
+    Args:
+        response_model: Model or typing shape the response is parsed into
+
+    Returns:
+        The parser, or None if the body must be decoded before validation
+    """
+    if hasattr(response_model, "model_validate_json"):
+        return response_model.model_validate_json
+    if getattr(response_model, "__origin__", None) in (list, dict):
+        return _shape_adapter(response_model).validate_json
+    return None
+
+
+@lru_cache(maxsize=None)
+def _data_parser(response_model: Any) -> Callable[[Any], Any]:
+    """
+    Return a parser for decoded response data.
+
+    The model is inspected once; later responses for the same model go
+    straight to the resolved parser.
+
+    Args:
+        response_model: Model or typing shape the response is parsed into
+
+    Returns:
+        A function validating decoded data against the model
+    """
+    origin = getattr(response_model, "__origin__", None)
+
+    # List[Model] types
+    if origin is list:
+        item_type = getattr(response_model, "__args__", [None])[0]
+        validate_list = _list_adapter(item_type).validate_python if item_type else None
+
+        def parse_list(data: Any) -> Any:
+            if validate_list is None or not isinstance(data, list):
+                raise ValueError(f"Expected list response, got {type(data)}")
+            return validate_list(data)
+
+        return parse_list
+
+    # Dict[str, Model] types; other dict shapes are returned as-is
+    if origin is dict:
+        args = getattr(response_model, "__args__", ())
+        if len(args) == 2 and hasattr(args[1], "model_validate"):
+            validate_dict = _shape_adapter(response_model).validate_python
+
+            def parse_dict(data: Any) -> Any:
+                return validate_dict(data) if isinstance(data, dict) else data
+
+            return parse_dict
+        return _identity
+
+    # Regular Pydantic models
+    if hasattr(response_model, "model_validate"):
+        return response_model.model_validate
+
+    # For non-pydantic types, return as-is
+    return _identity
+
+
 class BaseService:
     """
     Base service class providing common HTTP client functionality.
@@ -44,6 +129,7 @@ class BaseService:
         data: Any = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> Any:
         """
         Make an HTTP request and parse the response into a model.
@@ -55,6 +141,7 @@ class BaseService:
             data: Request body data
             params: Query parameters
             headers: Additional headers
+            raw: Fetch the raw body and validate it straight from JSON
 
         Returns:
             Parsed response model instance
@@ -78,6 +165,7 @@ class BaseService:
                 data=data,
                 params=params,
                 headers=headers,
+                raw=raw,
             )
 
             # Handle special cases for response parsing
@@ -104,44 +192,23 @@ class BaseService:
 
     def _parse_response(self, response_data: Any, response_model: Type[T]) -> Any:
         """Parse response data based on response model type."""
+        # Raw JSON bodies are parsed and validated in a single pass
+        if isinstance(response_data, bytes):
+            if not response_data:
+                response_data = None
+            else:
+                parse_json = _json_parser(response_model)
+                if parse_json is not None:
+                    return parse_json(response_data)
+                response_data = json.loads(response_data)
+
         # Handle None responses
         if response_data is None:
             if hasattr(response_model, "model_validate"):
                 return response_model()
             return None
 
-        # Handle List[Model] types - check for typing generics
-        if hasattr(response_model, "__origin__"):
-            origin = getattr(response_model, "__origin__", None)
-            if origin is list:
-                item_type = getattr(response_model, "__args__", [None])[0]
-                if item_type and isinstance(response_data, list):
-                    return [item_type.model_validate(item) for item in response_data]
-                else:
-                    raise ValueError(
-                        f"Expected list response, got {type(response_data)}"
-                    )
-            elif origin is dict:
-                # For Dict[str, Model] types
-                args = getattr(response_model, "__args__", [])
-                if len(args) == 2:
-                    _, value_type = args
-                    if hasattr(value_type, "model_validate") and isinstance(
-                        response_data, dict
-                    ):
-                        return {
-                            k: value_type.model_validate(v)
-                            for k, v in response_data.items()
-                        }
-                return response_data
-
-        # Handle regular Pydantic models
-        if hasattr(response_model, "model_validate"):
-            # type: ignore[attr-defined]
-            return response_model.model_validate(response_data)
-
-        # For non-pydantic types, return as-is
-        return response_data
+        return _data_parser(response_model)(response_data)
 
     async def _make_list_request(
         self,
@@ -151,6 +218,7 @@ class BaseService:
         data: Any = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> List[T]:
         """
         Make an HTTP request expecting a list response.
@@ -162,6 +230,7 @@ class BaseService:
             data: Request body data
             params: Query parameters
             headers: Additional headers
+            raw: Fetch the raw body and validate it straight from JSON
 
         Returns:
             List of parsed model instances
@@ -173,13 +242,16 @@ class BaseService:
                 data=data,
                 params=params,
                 headers=headers,
+                raw=raw,
             )
 
+            if isinstance(response_data, bytes):
+                return _list_adapter(item_model).validate_json(response_data)
+
             if not isinstance(response_data, list):
                 raise ValueError(f"Expected list response, got {type(response_data)}")
 
-            # type: ignore[attr-defined]
-            return [item_model.model_validate(item) for item in response_data]
+            return _list_adapter(item_model).validate_python(response_data)
 
         except (HTTPError, AuthenticationError, RateLimitError):
             raise
@@ -198,10 +270,11 @@ class BaseService:
         response_model: Type[T],
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> T:
         """Make a GET request."""
         return await self._make_request(
-            "GET", endpoint, response_model, params=params, headers=headers
+            "GET", endpoint, response_model, params=params, headers=headers, raw=raw
         )
 
     async def _get_list(
@@ -210,10 +283,11 @@ class BaseService:
         item_model: Type[T],
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> List[T]:
         """Make a GET request expecting a list response."""
         return await self._make_list_request(
-            "GET", endpoint, item_model, params=params, headers=headers
+            "GET", endpoint, item_model, params=params, headers=headers, raw=raw
         )
 
     async def _post(
@@ -223,10 +297,17 @@ class BaseService:
         data: Any = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> T:
         """Make a POST request."""
         return await self._make_request(
-            "POST", endpoint, response_model, data=data, params=params, headers=headers
+            "POST",
+            endpoint,
+            response_model,
+            data=data,
+            params=params,
+            headers=headers,
+            raw=raw,
         )
 
     async def _put(
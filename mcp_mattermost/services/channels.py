@@ -46,9 +46,7 @@ class ChannelsService(BaseService):
         Returns:
             Created channel
         """
-        return await self._post(
-            "channels", Channel, data=channel_data.model_dump(exclude_none=True)
-        )
+        return await self._post("channels", Channel, data=channel_data)
 
     async def get_channel(self, channel_id: str) -> Channel:
         """
@@ -91,7 +89,7 @@ class ChannelsService(BaseService):
         return await self._put(
             f"channels/{channel_id}",
             Channel,
-            data=channel_patch.model_dump(exclude_none=True),
+            data=channel_patch,
         )
 
     async def patch_channel(
@@ -110,7 +108,7 @@ class ChannelsService(BaseService):
         return await self._patch(
             f"channels/{channel_id}/patch",
             Channel,
-            data=channel_patch.model_dump(exclude_none=True),
+            data=channel_patch,
         )
 
     async def delete_channel(self, channel_id: str) -> MattermostResponse:
@@ -150,7 +148,9 @@ class ChannelsService(BaseService):
             include_deleted=include_deleted,
         )
 
-        return await self._get_list(f"teams/{team_id}/channels", Channel, params=params)
+        return await self._get_list(
+            f"teams/{team_id}/channels", Channel, params=params, raw=True
+        )
 
     async def get_public_channels_for_team(
         self,
@@ -171,7 +171,7 @@ class ChannelsService(BaseService):
         """
         params = self._build_query_params(page=page, per_page=per_page)
         return await self._get_list(
-            f"teams/{team_id}/channels/public", Channel, params=params
+            f"teams/{team_id}/channels/public", Channel, params=params, raw=True
         )
 
     async def search_channels(
@@ -190,7 +190,7 @@ class ChannelsService(BaseService):
         return await self._post(
             f"teams/{team_id}/channels/search",
             List[Channel],
-            data=search_data.model_dump(exclude_none=True),
+            data=search_data,
         )
 
     async def get_channel_stats(self, channel_id: str) -> ChannelStats:
@@ -43,9 +43,7 @@ class PostsService(BaseService):
         Returns:
             Created post
         """
-        return await self._post(
-            "posts", Post, data=post_data.model_dump(exclude_none=True)
-        )
+        return await self._post("posts", Post, data=post_data)
 
     async def get_post(self, post_id: str) -> Post:
         """
@@ -70,9 +68,7 @@ class PostsService(BaseService):
         Returns:
             Updated post
         """
-        return await self._put(
-            f"posts/{post_id}", Post, data=post_patch.model_dump(exclude_none=True)
-        )
+        return await self._put(f"posts/{post_id}", Post, data=post_patch)
 
     async def patch_post(self, post_id: str, post_patch: PostPatch) -> Post:
         """
@@ -88,7 +84,7 @@ class PostsService(BaseService):
         return await self._patch(
             f"posts/{post_id}/patch",
             Post,
-            data=post_patch.model_dump(exclude_none=True),
+            data=post_patch,
         )
 
     async def delete_post(self, post_id: str) -> MattermostResponse:
@@ -134,7 +130,9 @@ class PostsService(BaseService):
             after=after,
         )
 
-        return await self._get(f"channels/{channel_id}/posts", PostList, params=params)
+        return await self._get(
+            f"channels/{channel_id}/posts", PostList, params=params, raw=True
+        )
 
     async def get_posts_around(
         self,
@@ -157,7 +155,10 @@ class PostsService(BaseService):
         """
         params = self._build_query_params(before=before, after=after)
         return await self._get(
-            f"channels/{channel_id}/posts/{post_id}/context", PostList, params=params
+            f"channels/{channel_id}/posts/{post_id}/context",
+            PostList,
+            params=params,
+            raw=True,
         )
 
     async def get_posts_since(self, channel_id: str, since: int) -> PostList:
@@ -172,7 +173,9 @@ class PostsService(BaseService):
             List of posts since the timestamp
         """
         params = {"since": since}
-        return await self._get(f"channels/{channel_id}/posts", PostList, params=params)
+        return await self._get(
+            f"channels/{channel_id}/posts", PostList, params=params, raw=True
+        )
 
     async def search_posts(
         self,
@@ -192,7 +195,7 @@ class PostsService(BaseService):
         return await self._post(
             f"teams/{team_id}/posts/search",
             PostListWithSearchMatches,
-            data=search_data.model_dump(exclude_none=True),
+            data=search_data,
         )
 
     async def pin_post(self, post_id: str) -> MattermostResponse:
@@ -47,9 +47,7 @@ class TeamsService(BaseService):
         Returns:
             Created team
         """
-        return await self._post(
-            "teams", Team, data=team_data.model_dump(exclude_none=True)
-        )
+        return await self._post("teams", Team, data=team_data)
 
     async def get_team(self, team_id: str) -> Team:
         """
@@ -86,9 +84,7 @@ class TeamsService(BaseService):
         Returns:
             Updated team
         """
-        return await self._put(
-            f"teams/{team_id}", Team, data=team_patch.model_dump(exclude_none=True)
-        )
+        return await self._put(f"teams/{team_id}", Team, data=team_patch)
 
     async def patch_team(self, team_id: str, team_patch: TeamPatch) -> Team:
         """
@@ -104,7 +100,7 @@ class TeamsService(BaseService):
         return await self._patch(
             f"teams/{team_id}/patch",
             Team,
-            data=team_patch.model_dump(exclude_none=True),
+            data=team_patch,
         )
 
     async def delete_team(
@@ -158,9 +154,7 @@ class TeamsService(BaseService):
         Returns:
             List of matching teams
         """
-        return await self._post(
-            "teams/search", List[Team], data=search_data.model_dump(exclude_none=True)
-        )
+        return await self._post("teams/search", List[Team], data=search_data)
 
     async def add_team_member(self, team_id: str, user_id: str) -> TeamMember:
         """
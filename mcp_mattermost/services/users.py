@@ -44,9 +44,7 @@ class UsersService(BaseService):
         Returns:
             Created user
         """
-        return await self._post(
-            "users", User, data=user_data.model_dump(exclude_none=True)
-        )
+        return await self._post("users", User, data=user_data)
 
     async def get_user(self, user_id: str) -> User:
         """
@@ -95,9 +93,7 @@ class UsersService(BaseService):
         Returns:
             Updated user
         """
-        return await self._put(
-            f"users/{user_id}", User, data=user_patch.model_dump(exclude_none=True)
-        )
+        return await self._put(f"users/{user_id}", User, data=user_patch)
 
     async def patch_user(self, user_id: str, user_patch: UserPatch) -> User:
         """
@@ -113,7 +109,7 @@ class UsersService(BaseService):
         return await self._patch(
             f"users/{user_id}/patch",
             User,
-            data=user_patch.model_dump(exclude_none=True),
+            data=user_patch,
         )
 
     async def delete_user(self, user_id: str) -> MattermostResponse:
@@ -187,7 +183,7 @@ class UsersService(BaseService):
             team_roles=",".join(team_roles) if team_roles else None,
         )
 
-        return await self._get_list("users", User, params=params)
+        return await self._get_list("users", User, params=params, raw=True)
 
     async def get_users_by_ids(self, user_ids: List[str]) -> List[User]:
         """
@@ -199,7 +195,7 @@ class UsersService(BaseService):
         Returns:
             List of users
         """
-        return await self._post("users/ids", List[User], data=user_ids)
+        return await self._post("users/ids", List[User], data=user_ids, raw=True)
 
     async def get_users_by_usernames(self, usernames: List[str]) -> List[User]:
         """
@@ -211,7 +207,7 @@ class UsersService(BaseService):
         Returns:
             List of users
         """
-        return await self._post("users/usernames", List[User], data=usernames)
+        return await self._post("users/usernames", List[User], data=usernames, raw=True)
 
     async def search_users(
         self,
@@ -254,7 +250,7 @@ class UsersService(BaseService):
             limit=limit,
         )
 
-        return await self._post("users/search", List[User], data=data)
+        return await self._post("users/search", List[User], data=data, raw=True)
 
     async def autocomplete_users(
         self,
@@ -282,7 +278,9 @@ class UsersService(BaseService):
             limit=limit,
         )
 
-        return await self._get("users/autocomplete", UserAutocomplete, params=params)
+        return await self._get(
+            "users/autocomplete", UserAutocomplete, params=params, raw=True
+        )
 
     async def get_user_stats(self) -> UsersStats:
         """
@@ -312,9 +310,7 @@ class UsersService(BaseService):
         Returns:
             Updated user
         """
-        return await self._put(
-            "users/me", User, data=user_patch.model_dump(exclude_none=True)
-        )
+        return await self._put("users/me", User, data=user_patch)
 
     async def get_user_image(self, user_id: str) -> bytes:
         """
@@ -8,7 +8,19 @@ that call the service layer methods.
 import asyncio
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import structlog
 from pydantic import BaseModel
@@ -18,6 +30,15 @@ logger = structlog.get_logger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of a JSON-like value."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 @dataclass
 class MCPToolDefinition:
     """
@@ -37,11 +58,15 @@ class MCPToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, MCPToolDefinition] = {}
+        # Advertised tool list with read-only schemas, rebuilt only when the
+        # registry changes
+        self._tool_list: Optional[Tuple[Mapping[str, Any], ...]] = None
         self.logger = logger.bind(component="tool_registry")
 
     def register(self, tool: MCPToolDefinition) -> None:
         """Register a tool definition."""
         self._tools[tool.name] = tool
+        self._tool_list = None
         self.logger.info("Registered tool", name=tool.name)
 
     def get_tool(self, name: str) -> Optional[MCPToolDefinition]:
@@ -50,14 +75,16 @@ class MCPToolRegistry:
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """Get all tool definitions for MCP protocol."""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema,
-            }
-            for tool in self._tools.values()
-        ]
+        if self._tool_list is None:
+            self._tool_list = tuple(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": _freeze(tool.input_schema),
+                }
+                for tool in self._tools.values()
+            )
+        return [{**tool} for tool in self._tool_list]
 
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """Call a tool by name with arguments."""
@@ -15,6 +15,8 @@ import httpx
 import pytest
 import respx
 
+from mcp_mattermost.models.posts import PostCreate
+
 
 # Mock HTTPXMock for skipped tests to avoid linter errors
 class HTTPXMock:
@@ -156,6 +158,13 @@ class TestAsyncHTTPClient:
         assert data == test_string
         assert headers == {}
 
+        # Test model data (serialized directly, dropping unset fields)
+        data, headers = client._prepare_data(
+            PostCreate(channel_id="channel123", message="Hi")
+        )
+        assert json.loads(data) == {"channel_id": "channel123", "message": "Hi"}
+        assert headers["Content-Type"] == "application/json"
+
     def test_response_parsing(self):
         """Test response data parsing."""
         client = AsyncHTTPClient(self.base_url)
@@ -0,0 +1,214 @@
+"""
+Tests for Mattermost data models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_mattermost.models import (
+    Channel,
+    ChannelKind,
+    OutgoingWebhook,
+    Post,
+    PostCreate,
+    User,
+)
+
+
+class TestChannel:
+    """Test Channel model helpers."""
+
+    @pytest.mark.parametrize(
+        "channel_type,kind",
+        [
+            ("O", ChannelKind.PUBLIC),
+            ("P", ChannelKind.PRIVATE),
+            ("D", ChannelKind.DIRECT),
+            ("G", ChannelKind.GROUP),
+            (None, ChannelKind.UNKNOWN),
+            ("X", ChannelKind.UNKNOWN),
+        ],
+    )
+    def test_channel_kind(self, channel_type, kind):
+        """Test channel kind dispatch on the channel type."""
+        channel = Channel(type=channel_type)
+
+        assert channel.channel_kind is kind
+        assert channel.is_public is (kind is ChannelKind.PUBLIC)
+        assert channel.is_private is (kind is ChannelKind.PRIVATE)
+        assert channel.is_direct_message is (kind is ChannelKind.DIRECT)
+        assert channel.is_group_message is (kind is ChannelKind.GROUP)
+
+    def test_channel_kind_reads_current_type(self):
+        """Test that the kind is derived from the current type, not stored."""
+        channel = Channel(type="O")
+        assert channel.is_public
+
+        channel.type = "P"
+
+        assert channel.is_private
+        assert "channel_kind" not in channel.model_dump()
+
+    def test_null_timestamps_default_to_zero(self):
+        """Test that explicit null server timestamps validate as 0."""
+        channel = Channel.model_validate(
+            {"id": "ch1", "last_post_at": None, "extra_update_at": None}
+        )
+
+        assert channel.last_post_at == 0
+        assert channel.extra_update_at == 0
+
+
+class TestPost:
+    """Test Post model validation."""
+
+    def test_ids_are_interned(self):
+        """Test that repeated entity IDs share a single string object."""
+        channel_id = "".join(["channel", "1" * 19])
+        posts = Post.validate_many_json(
+            f'[{{"id": "p1", "channel_id": "{channel_id}"}},'
+            f' {{"id": "p2", "channel_id": "{channel_id}"}}]'
+        )
+
+        assert posts[0].channel_id == channel_id
+        assert posts[0].channel_id is posts[1].channel_id
+
+    def test_null_edit_at_in_list(self):
+        """Test that a null edit_at does not fail a bulk post response."""
+        posts = Post.validate_many_json(
+            '[{"id": "p1", "edit_at": null}, {"id": "p2", "edit_at": 5}]'
+        )
+
+        assert [post.edit_at for post in posts] == [0, 5]
+        assert not posts[0].is_edited
+
+    def test_flags_read_current_fields(self):
+        """Test that post flags are derived from the current field values."""
+        post = Post(id="post1", edit_at=0)
+        assert not post.is_reply
+        assert not post.is_edited
+        assert not post.has_attachments
+
+        post.root_id = "root1"
+        post.edit_at = 5
+        post.file_ids = ["file1"]
+
+        assert post.is_reply
+        assert post.is_edited
+        assert post.has_attachments
+
+
+class TestUser:
+    """Test User model helpers."""
+
+    @pytest.mark.parametrize(
+        "fields,display_name",
+        [
+            ({"nickname": "Nick", "first_name": "Ada"}, "Nick"),
+            ({"first_name": "Ada", "last_name": "Lovelace"}, "Ada Lovelace"),
+            ({"first_name": "Ada", "username": "ada"}, "Ada"),
+            ({"last_name": "Lovelace", "username": "ada"}, "ada"),
+            ({"nickname": ""}, "Unknown User"),
+        ],
+    )
+    def test_display_name(self, fields, display_name):
+        """Test display name fallback order."""
+        assert User(**fields).display_name == display_name
+
+    def test_repeated_values_are_interned(self):
+        """Test that low-cardinality user fields share string objects."""
+        role = "".join(["system_", "user"])
+        users = [User(roles=role), User.model_validate_json('{"roles": "system_user"}')]
+
+        assert users[0].roles is users[1].roles
+
+    def test_names_refresh_on_assignment(self):
+        """Test that names reflect a name change."""
+        user = User(first_name="Ada", last_name="Lovelace")
+        assert user.full_name == "Ada Lovelace"
+
+        user.last_name = "King"
+
+        assert user.display_name == "Ada King"
+        assert user.full_name == "Ada King"
+
+
+class TestOutgoingWebhook:
+    """Test OutgoingWebhook trigger matching."""
+
+    @pytest.mark.parametrize(
+        "trigger_when,message,triggered",
+        [
+            (0, "deploy now", True),
+            (0, "please deploy now", False),
+            (0, "deployment done", False),
+            (0, "", False),
+            (1, "deploy now", True),
+            (1, "deployment done", True),
+            (1, "please deploy", False),
+        ],
+    )
+    def test_is_triggered_by(self, trigger_when, message, triggered):
+        """Test trigger word matching for both trigger modes."""
+        webhook = OutgoingWebhook(
+            trigger_words=["deploy", "rollback"], trigger_when=trigger_when
+        )
+
+        assert webhook.is_triggered_by(message) is triggered
+
+    def test_no_trigger_words(self):
+        """Test that a webhook without trigger words never fires."""
+        assert not OutgoingWebhook(trigger_when=1).is_triggered_by("deploy")
+
+    def test_trigger_words_follow_assignment(self):
+        """Test that reassigned trigger words are used for matching."""
+        webhook = OutgoingWebhook(trigger_words=["deploy"], trigger_when=0)
+        assert webhook.trigger_word_set is webhook.trigger_word_set
+
+        webhook.trigger_words = ["rollback"]
+
+        assert webhook.is_triggered_by("rollback now")
+        assert not webhook.is_triggered_by("deploy now")
+
+    def test_unknown_server_values_are_accepted(self):
+        """Test that response webhooks keep values outside the request Literals."""
+        webhook = OutgoingWebhook.model_validate_json(
+            '{"content_type": "", "trigger_when": 2}'
+        )
+
+        assert webhook.content_type == ""
+        assert webhook.trigger_when == 2
+
+
+class TestRequestModels:
+    """Test request body models."""
+
+    def test_unknown_fields_are_rejected(self):
+        """Test that request models reject fields they do not declare."""
+        with pytest.raises(ValidationError):
+            PostCreate(channel_id="channel123", message="Hi", mesage="typo")
+
+    def test_response_models_keep_unknown_fields(self):
+        """Test that response models still accept new server fields."""
+        post = Post(id="post1", new_server_field=True)
+
+        assert post.model_extra == {"new_server_field": True}
+
+
+class TestLazyModels:
+    """Test lazily imported model modules."""
+
+    def test_webhook_models_resolve_on_access(self):
+        """Test that webhook models are importable from the package."""
+        from mcp_mattermost import models
+        from mcp_mattermost.models import webhooks
+
+        assert models.IncomingWebhook is webhooks.IncomingWebhook
+        assert "Bot" in dir(webhooks)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        from mcp_mattermost import models
+
+        with pytest.raises(AttributeError):
+            models.NotAModel
@@ -2,6 +2,8 @@
 Tests for the MattermostMCPServer class.
 """
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from mcp_mattermost.server import MattermostMCPServer
@@ -44,3 +46,36 @@ class TestMattermostMCPServer:
         # These should not raise exceptions
         await server.start()
         await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_falls_back_to_polling(self):
+        """Test that a streaming failure is tolerated when polling starts."""
+        server = MattermostMCPServer(enable_streaming=True, enable_polling=True)
+
+        with patch.object(
+            server, "_initialize_websocket_client", AsyncMock()
+        ), patch.object(
+            server, "_start_streaming", AsyncMock(side_effect=RuntimeError("down"))
+        ), patch.object(
+            server, "_start_polling", AsyncMock()
+        ) as start_polling:
+            await server.start()
+
+        start_polling.assert_awaited_once()
+        assert server._is_running
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_fails_without_fallback(self):
+        """Test that a streaming failure is fatal when polling is disabled."""
+        server = MattermostMCPServer(enable_streaming=True, enable_polling=False)
+
+        with patch.object(
+            server, "_initialize_websocket_client", AsyncMock()
+        ), patch.object(
+            server, "_start_streaming", AsyncMock(side_effect=RuntimeError("down"))
+        ):
+            with pytest.raises(RuntimeError):
+                await server.start()
+
+        assert not server._is_running
@@ -5,6 +5,8 @@ This module tests the service classes that provide high-level API operations
 for different Mattermost domains like posts, channels, etc.
 """
 
+import json
+from typing import Any, Dict, List
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -46,7 +48,12 @@ class TestBaseService:
 
         # Verify request was made
         self.mock_client.request.assert_called_once_with(
-            method="GET", endpoint="/test", data=None, params=None, headers=None
+            method="GET",
+            endpoint="/test",
+            data=None,
+            params=None,
+            headers=None,
+            raw=False,
         )
 
         # Verify result
@@ -70,6 +77,7 @@ class TestBaseService:
             data=request_data,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -85,7 +93,12 @@ class TestBaseService:
         )
 
         self.mock_client.request.assert_called_once_with(
-            method="GET", endpoint="/items", data=None, params=params, headers=headers
+            method="GET",
+            endpoint="/items",
+            data=None,
+            params=params,
+            headers=headers,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -143,6 +156,50 @@ class TestBaseService:
 
         assert "Expected list response" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_make_request_raw_list_response(self):
+        """Test that raw list bodies are validated straight from JSON."""
+        self.mock_client.request.return_value = b'[{"id": "item1"}, {"id": "item2"}]'
+
+        result = await self.service._post(
+            "/items/ids", List[MattermostResponse], data=["item1", "item2"], raw=True
+        )
+
+        assert [item.id for item in result] == ["item1", "item2"]
+        self.mock_client.request.assert_called_once_with(
+            method="POST",
+            endpoint="/items/ids",
+            data=["item1", "item2"],
+            params=None,
+            headers=None,
+            raw=True,
+        )
+
+    @pytest.mark.parametrize(
+        "response_model,response_data,expected",
+        [
+            (List[MattermostResponse], [{"id": "a"}], [MattermostResponse(id="a")]),
+            (
+                Dict[str, MattermostResponse],
+                {"a": {"id": "a"}},
+                {"a": MattermostResponse(id="a")},
+            ),
+            (Dict[str, Any], {"a": 1}, {"a": 1}),
+            (dict, {"a": 1}, {"a": 1}),
+        ],
+    )
+    def test_parse_response_shapes(self, response_model, response_data, expected):
+        """Test that each response shape dispatches to the right parser."""
+        for _ in range(2):
+            assert (
+                self.service._parse_response(response_data, response_model) == expected
+            )
+
+    def test_parse_response_rejects_non_list(self):
+        """Test that a list model rejects a non-list response."""
+        with pytest.raises(ValueError, match="Expected list response"):
+            self.service._parse_response({"id": "a"}, List[MattermostResponse])
+
     def test_build_query_params(self):
         """Test query parameter building."""
         params = self.service._build_query_params(
@@ -161,7 +218,12 @@ class TestBaseService:
         # Test GET
         await self.service._get("/test", MattermostResponse)
         self.mock_client.request.assert_called_with(
-            method="GET", endpoint="/test", data=None, params=None, headers=None
+            method="GET",
+            endpoint="/test",
+            data=None,
+            params=None,
+            headers=None,
+            raw=False,
         )
 
         # Test POST
@@ -172,6 +234,7 @@ class TestBaseService:
             data={"test": "data"},
             params=None,
             headers=None,
+            raw=False,
         )
 
         # Test PUT
@@ -182,6 +245,7 @@ class TestBaseService:
             data={"test": "data"},
             params=None,
             headers=None,
+            raw=False,
         )
 
         # Test PATCH
@@ -192,12 +256,18 @@ class TestBaseService:
             data={"test": "data"},
             params=None,
             headers=None,
+            raw=False,
         )
 
         # Test DELETE
         await self.service._delete("/test", MattermostResponse)
         self.mock_client.request.assert_called_with(
-            method="DELETE", endpoint="/test", data=None, params=None, headers=None
+            method="DELETE",
+            endpoint="/test",
+            data=None,
+            params=None,
+            headers=None,
+            raw=False,
         )
 
 
@@ -249,9 +319,10 @@ class TestPostsService:
         self.mock_client.request.assert_called_once_with(
             method="POST",
             endpoint="posts",
-            data=post_data.model_dump(exclude_none=True),
+            data=post_data,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -294,6 +365,7 @@ class TestPostsService:
             data=None,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -335,9 +407,10 @@ class TestPostsService:
         self.mock_client.request.assert_called_once_with(
             method="PUT",
             endpoint=f"posts/{post_id}",
-            data=post_patch.model_dump(exclude_none=True),
+            data=post_patch,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -356,6 +429,7 @@ class TestPostsService:
             data=None,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -415,7 +489,7 @@ class TestPostsService:
             "has_next": False,
         }
 
-        self.mock_client.request.return_value = response_data
+        self.mock_client.request.return_value = json.dumps(response_data).encode()
 
         result = await self.service.get_posts_for_channel(
             channel_id, page=0, per_page=50
@@ -432,6 +506,7 @@ class TestPostsService:
             data=None,
             params={"page": 0, "per_page": 50},
             headers=None,
+            raw=True,
         )
 
     @pytest.mark.asyncio
@@ -463,6 +538,7 @@ class TestPostsService:
             data={"user_id": user_id, "post_id": post_id, "emoji_name": emoji_name},
             params=None,
             headers=None,
+            raw=False,
         )
 
 
@@ -522,9 +598,10 @@ class TestChannelsService:
         self.mock_client.request.assert_called_once_with(
             method="POST",
             endpoint="channels",
-            data=channel_data.model_dump(exclude_none=True),
+            data=channel_data,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -568,6 +645,7 @@ class TestChannelsService:
             data=None,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -612,6 +690,7 @@ class TestChannelsService:
             data=None,
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -656,6 +735,7 @@ class TestChannelsService:
             data={"user_id": user_id},
             params=None,
             headers=None,
+            raw=False,
         )
 
     @pytest.mark.asyncio
@@ -711,7 +791,7 @@ class TestChannelsService:
             },
         ]
 
-        self.mock_client.request.return_value = response_data
+        self.mock_client.request.return_value = json.dumps(response_data).encode()
 
         result = await self.service.get_channels_for_team(team_id, page=0, per_page=50)
 
@@ -726,6 +806,7 @@ class TestChannelsService:
             data=None,
             params={"page": 0, "per_page": 50, "include_deleted": False},
             headers=None,
+            raw=True,
         )
 
 
@@ -2,10 +2,13 @@
 Tests for streaming MCP resources.
 """
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from mcp_mattermost import resources
+from mcp_mattermost.events.websocket import MattermostWebSocketClient
 from mcp_mattermost.resources import (
     MCPResourceRegistry,
     NewChannelPostResource,
@@ -13,9 +16,60 @@ from mcp_mattermost.resources import (
     ResourceUpdate,
     ResourceUpdateType,
 )
+from mcp_mattermost.resources.base import MAX_POLL_BACKOFF_SECONDS, _backoff_delay
 from mcp_mattermost.server import MattermostMCPServer
 
 
+class TestResourcesPackage:
+    """Test the resources package exports."""
+
+    def test_all_exports_resolve(self):
+        """Test that every name in __all__ can be imported."""
+        assert resources.__all__
+        for name in resources.__all__:
+            assert getattr(resources, name).__name__ == name
+
+
+class TestPollingBackoff:
+    """Test the polling error backoff delay."""
+
+    @pytest.mark.parametrize(
+        "errors,base_delay",
+        [(1, 20.0), (2, 40.0), (3, 80.0), (10, MAX_POLL_BACKOFF_SECONDS)],
+    )
+    def test_backoff_delay(self, errors, base_delay):
+        """Test that the delay doubles per error, is capped and jittered."""
+        with patch("random.uniform", return_value=0.0):
+            assert _backoff_delay(10.0, errors) == base_delay
+
+        delay = _backoff_delay(10.0, errors)
+        assert base_delay <= delay <= base_delay + 10.0
+
+
+class TestWebSocketConnectionWait:
+    """Test waiting for the WebSocket client to connect."""
+
+    @pytest.mark.asyncio
+    async def test_wait_until_connected(self):
+        """Test that waiters wake up once authentication completes."""
+        client = MattermostWebSocketClient("https://mm.example.com", "token")
+
+        def authenticate():
+            client._is_connected = True
+            client._set_authenticated(True)
+
+        asyncio.get_running_loop().call_later(0.01, authenticate)
+
+        assert await client.wait_until_connected(timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_wait_until_connected_times_out(self):
+        """Test that the wait gives up after the timeout."""
+        client = MattermostWebSocketClient("https://mm.example.com", "token")
+
+        assert not await client.wait_until_connected(timeout=0.01)
+
+
 class TestResourceUpdate:
     """Test ResourceUpdate dataclass."""
 
@@ -95,6 +149,202 @@ class TestNewChannelPostResource:
         assert definition.supports_polling is True
         assert definition.mime_type == "application/json"
 
+    @pytest.mark.asyncio
+    async def test_unsubscribe_during_emit(self):
+        """Test that callbacks may unsubscribe while an update is emitted."""
+        resource = NewChannelPostResource()
+        received = []
+
+        def first(update):
+            received.append("first")
+            resource.unsubscribe(first)
+
+        def second(update):
+            received.append("second")
+
+        resource.subscribe(first)
+        resource.subscribe(first)
+        resource.subscribe(second)
+        update = ResourceUpdate(
+            resource_uri=resource.uri,
+            update_type=ResourceUpdateType.CREATED,
+            data={},
+        )
+
+        await resource.emit_update(update)
+        await resource.emit_update(update)
+
+        assert received == ["first", "second", "second"]
+
+    @pytest.mark.asyncio
+    async def test_queue_subscriber_drops_when_full(self):
+        """Test that a full queue drops updates and reports how many."""
+        resource = NewChannelPostResource()
+        queue = resource.subscribe_queue(maxsize=2)
+
+        for index in range(4):
+            await resource.emit_update(
+                ResourceUpdate(
+                    resource_uri=resource.uri,
+                    update_type=ResourceUpdateType.CREATED,
+                    data={},
+                    event_id=f"e{index}",
+                )
+            )
+        assert [queue.get_nowait().event_id for _ in range(2)] == ["e0", "e1"]
+
+        await resource.emit_update(
+            ResourceUpdate(
+                resource_uri=resource.uri,
+                update_type=ResourceUpdateType.CREATED,
+                data={},
+                event_id="e4",
+            )
+        )
+        notice = queue.get_nowait()
+
+        assert notice.update_type == ResourceUpdateType.DROPPED
+        assert notice.data == {"dropped": 2}
+        assert queue.get_nowait().event_id == "e4"
+
+        resource.unsubscribe_queue(queue)
+        assert not resource._has_subscribers
+
+    def test_post_events_are_delivered_synchronously(self):
+        """Test that WebSocket post events reach subscribers without a task."""
+        resource = NewChannelPostResource(channel_ids=["ch1"])
+        received = []
+        resource.subscribe(received.append)
+
+        for post_id, channel_id in (("p1", "ch1"), ("p2", "ch2"), ("p3", "ch1")):
+            resource._handle_new_post_event(
+                {"data": {"id": post_id, "channel_id": channel_id}}
+            )
+
+        assert [u.event_id for u in received] == ["post_p1", "post_p3"]
+
+    def test_replayed_post_events_are_dropped(self):
+        """Test that a post event seen recently is not emitted again."""
+        resource = NewChannelPostResource()
+        received = []
+        resource.subscribe(received.append)
+        event = {"data": {"id": "p1", "channel_id": "ch1"}}
+
+        resource._handle_new_post_event(event)
+        resource._handle_new_post_event(event)
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_emits_new_posts_oldest_first(self):
+        """Test that polling emits only newer posts, in creation order."""
+        resource = NewChannelPostResource(channel_ids=["ch1"])
+        resource._last_post_times["ch1"] = 100
+        received = []
+        resource.subscribe(received.append)
+
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value.get = AsyncMock(
+            return_value={
+                "posts": {
+                    "p3": {"id": "p3", "create_at": 300},
+                    "p0": {"id": "p0", "create_at": 50},
+                    "p2": {"id": "p2", "create_at": 200},
+                }
+            }
+        )
+
+        with patch(
+            "mcp_mattermost.resources.channel_posts.get_auth_state",
+            return_value=auth_state,
+        ):
+            await resource._poll_channel_posts("ch1")
+
+        assert [u.event_id for u in received] == ["post_p2", "post_p3"]
+        assert resource._last_post_times["ch1"] == 300
+
+    @pytest.mark.asyncio
+    async def test_poll_skips_posts_delivered_by_stream(self):
+        """Test that a fallback poll does not repeat streamed posts."""
+        resource = NewChannelPostResource(channel_ids=["ch1"])
+        received = []
+        resource.subscribe(received.append)
+        resource._handle_new_post_event({"data": {"id": "p1", "channel_id": "ch1"}})
+
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value.get = AsyncMock(
+            return_value={
+                "posts": {
+                    "p1": {"id": "p1", "create_at": 100},
+                    "p2": {"id": "p2", "create_at": 200},
+                }
+            }
+        )
+
+        with patch(
+            "mcp_mattermost.resources.channel_posts.get_auth_state",
+            return_value=auth_state,
+        ):
+            await resource._poll_channel_posts("ch1")
+
+        assert [u.event_id for u in received] == ["post_p1", "post_p2"]
+
+    @pytest.mark.asyncio
+    async def test_polling_slows_down_while_stream_is_connected(self):
+        """Test that the polling loop backs off while streaming is up."""
+        resource = NewChannelPostResource(channel_ids=["ch1"])
+        resource.subscribe(lambda update: None)
+        resource._ws_client = MagicMock(is_connected=True)
+
+        with patch.object(resource, "_poll_for_updates", AsyncMock()) as poll:
+            await resource.start_polling(interval_seconds=0.01)
+            await asyncio.sleep(0.05)
+            # Only the first poll, which sets the baseline, has run
+            assert poll.await_count == 1
+
+            resource._ws_client.is_connected = False
+            await asyncio.sleep(0.05)
+            await resource.stop_polling()
+
+        assert poll.await_count > 1
+
+    @pytest.mark.asyncio
+    async def test_team_channel_ids_are_cached(self):
+        """Test that a team's channel list is reused until it expires."""
+        resource = NewChannelPostResource(team_id="team1")
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=[{"id": "ch1"}, {"id": "ch2"}])
+
+        first = await resource._get_team_channel_ids(http_client, "team1")
+        second = await resource._get_team_channel_ids(http_client, "team1")
+        resource._team_channel_ids_expires = 0.0
+        await resource._get_team_channel_ids(http_client, "team1")
+
+        assert first == second == ["ch1", "ch2"]
+        assert http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_skips_failing_channel(self):
+        """Test that one failing channel does not drop the other channels."""
+        resource = NewChannelPostResource(channel_ids=["ch1", "ch2"])
+
+        async def fake_get(path, params=None):
+            if path == "/channels/ch1/posts":
+                raise RuntimeError("boom")
+            return {"posts": {"p1": {"id": "p1", "channel_id": "ch2"}}}
+
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value.get = AsyncMock(side_effect=fake_get)
+
+        with patch(
+            "mcp_mattermost.resources.channel_posts.get_auth_state",
+            return_value=auth_state,
+        ):
+            result = await resource.read(resource.uri)
+
+        assert [post["id"] for post in result["posts"]] == ["p1"]
+        assert result["channels_monitored"] == 2
+
 
 class TestReactionResource:
     """Test ReactionResource class."""
@@ -123,6 +373,206 @@ class TestReactionResource:
 
         assert resource.supports_polling() is True
 
+    def test_reaction_event_needs_subscribers(self):
+        """Test that reaction events are only processed when someone listens."""
+        resource = ReactionResource()
+        event = {
+            "data": {"post_id": "p1", "user_id": "u1", "emoji_name": "tada"},
+            "broadcast": {"channel_id": "ch1"},
+        }
+
+        with patch.object(resource, "emit_update_nowait") as emit:
+            resource._handle_reaction_added_event(event)
+        emit.assert_not_called()
+
+        received = []
+        resource.subscribe(received.append)
+        resource._handle_reaction_added_event(event)
+
+        assert [u.event_id for u in received] == ["reaction_p1_u1_tada"]
+        assert received[0].data["channel_id"] == "ch1"
+
+    def test_streamed_reactions_only_tracked_for_polled_posts(self):
+        """Test that WebSocket reactions cannot grow the poll baseline."""
+        resource = ReactionResource()
+        resource.subscribe(lambda update: None)
+        resource._post_reactions = {"ch1": {"p1": (10, [])}}
+
+        for post_id in ("p1", "p2"):
+            resource._handle_reaction_added_event(
+                {
+                    "data": {"post_id": post_id, "user_id": "u1", "emoji_name": "+1"},
+                    "broadcast": {"channel_id": "ch1"},
+                }
+            )
+
+        assert resource._known_reactions == {("p1", "u1", "+1")}
+
+    @pytest.mark.asyncio
+    async def test_read_fetches_reactions_in_bulk(self):
+        """Test that reactions for a channel's posts come from one request."""
+        resource = ReactionResource(channel_ids=["ch1"])
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(
+            return_value={"posts": {"p1": {"id": "p1"}, "p2": {"id": "p2"}}}
+        )
+        http_client.post = AsyncMock(
+            return_value={
+                "p2": [{"user_id": "u1", "emoji_name": "tada", "create_at": 5}]
+            }
+        )
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value = http_client
+
+        with patch(
+            "mcp_mattermost.resources.reactions.get_auth_state",
+            return_value=auth_state,
+        ):
+            result = await resource.read(resource.uri)
+
+        http_client.post.assert_awaited_once_with(
+            "/posts/ids/reactions", json=["p1", "p2"]
+        )
+        assert result["reactions"] == [
+            {
+                "post_id": "p2",
+                "user_id": "u1",
+                "emoji_name": "tada",
+                "create_at": 5,
+                "channel_id": "ch1",
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_poll_reports_added_and_removed_reactions(self):
+        """Test that polling diffs reactions against the previous poll."""
+        resource = ReactionResource(channel_ids=["ch1"])
+        resource._known_reactions = {("p1", "u1", "tada"), ("p1", "u2", "eyes")}
+        resource._last_poll_time_ns = 1
+        received = []
+        resource.subscribe(received.append)
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value={"posts": {"p1": {"id": "p1"}}})
+        http_client.post = AsyncMock(
+            return_value={
+                "p1": [
+                    {"user_id": "u1", "emoji_name": "tada"},
+                    {"user_id": "u3", "emoji_name": "rocket"},
+                ]
+            }
+        )
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value = http_client
+
+        with patch(
+            "mcp_mattermost.resources.reactions.get_auth_state",
+            return_value=auth_state,
+        ):
+            await resource._poll_for_updates()
+
+        assert [u.event_id for u in received] == [
+            "reaction_p1_u3_rocket",
+            "reaction_removed_p1_u2_eyes",
+        ]
+        assert resource._known_reactions == {
+            ("p1", "u1", "tada"),
+            ("p1", "u3", "rocket"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_poll_keeps_reactions_of_failed_channel(self):
+        """Test that a failed channel fetch does not report its reactions removed."""
+        resource = ReactionResource(channel_ids=["ch1", "ch2"])
+        received = []
+        resource.subscribe(received.append)
+
+        posts = {
+            "ch1": {"p1": {"id": "p1", "update_at": 10}},
+            "ch2": {"p2": {"id": "p2", "update_at": 10}},
+        }
+        failing = set()
+
+        async def fake_get(path, params=None):
+            channel_id = path.split("/")[2]
+            if channel_id in failing:
+                raise RuntimeError("boom")
+            return {"posts": posts[channel_id]}
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(side_effect=fake_get)
+        http_client.post = AsyncMock(
+            side_effect=lambda path, json: {
+                post_id: [{"user_id": "u1", "emoji_name": "tada"}] for post_id in json
+            }
+        )
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value = http_client
+
+        with patch(
+            "mcp_mattermost.resources.reactions.get_auth_state",
+            return_value=auth_state,
+        ):
+            await resource._poll_for_updates()
+            failing.add("ch2")
+            await resource._poll_for_updates()
+            failing.clear()
+            await resource._poll_for_updates()
+
+        assert sorted(u.event_id for u in received) == [
+            "reaction_p1_u1_tada",
+            "reaction_p2_u1_tada",
+        ]
+        assert resource._known_reactions == {
+            ("p1", "u1", "tada"),
+            ("p2", "u1", "tada"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_poll_skips_reactions_for_unchanged_posts(self):
+        """Test that only posts with a newer update_at are re-fetched."""
+        resource = ReactionResource(channel_ids=["ch1"])
+        received = []
+        resource.subscribe(received.append)
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(
+            return_value={
+                "posts": {
+                    "p1": {"id": "p1", "update_at": 10},
+                    "p2": {"id": "p2", "update_at": 10},
+                }
+            }
+        )
+        http_client.post = AsyncMock(
+            return_value={"p1": [{"user_id": "u1", "emoji_name": "tada"}]}
+        )
+        auth_state = MagicMock()
+        auth_state.get_http_client.return_value = http_client
+
+        with patch(
+            "mcp_mattermost.resources.reactions.get_auth_state",
+            return_value=auth_state,
+        ):
+            await resource._poll_for_updates()
+            await resource._poll_for_updates()
+
+            http_client.get.return_value["posts"]["p2"]["update_at"] = 20
+            http_client.post.return_value = {
+                "p2": [{"user_id": "u2", "emoji_name": "eyes"}]
+            }
+            await resource._poll_for_updates()
+
+        assert [call.kwargs["json"] for call in http_client.post.await_args_list] == [
+            ["p1", "p2"],
+            ["p2"],
+        ]
+        assert [u.event_id for u in received] == [
+            "reaction_p1_u1_tada",
+            "reaction_p2_u2_eyes",
+        ]
+
 
 class TestMCPResourceRegistry:
     """Test MCPResourceRegistry class."""
@@ -171,6 +621,49 @@ class TestMCPResourceRegistry:
         assert "mattermost://new_channel_posts" in uris
         assert "mattermost://reactions" in uris
 
+    def test_list_resources_is_cached_until_registry_changes(self):
+        """Test that definitions are reused until a resource is (un)registered."""
+        registry = MCPResourceRegistry()
+        resource = NewChannelPostResource()
+        registry.register(resource)
+
+        first = registry.list_resources()
+        assert registry.list_resources()[0] is first[0]
+        registry.list_resource_dicts()
+        cached = registry._definition_dicts
+        registry.list_resource_dicts()[0]["name"] = "mutated"
+        assert registry._definition_dicts is cached
+        assert registry.list_resource_dicts()[0]["name"] == "new_channel_posts"
+
+        registry.register(ReactionResource())
+        assert len(registry.list_resources()) == 2
+        assert registry._definition_dicts is None
+        assert len(registry.list_resource_dicts()) == 2
+
+        registry.unregister(resource.uri)
+        assert [r.name for r in registry.list_resources()] == ["reactions"]
+        assert [r["name"] for r in registry.list_resource_dicts()] == ["reactions"]
+
+    def test_subscribe_all_covers_later_resources(self):
+        """Test that registry-wide subscribers follow (un)registration."""
+        registry = MCPResourceRegistry()
+        posts = NewChannelPostResource()
+        reactions = ReactionResource()
+        registry.register(posts)
+
+        def callback(update):
+            pass
+
+        registry.subscribe_all(callback)
+        registry.register(reactions)
+        assert posts._subscribers == reactions._subscribers == (callback,)
+
+        registry.unregister(reactions.uri)
+        assert reactions._subscribers == ()
+
+        registry.unsubscribe_all(callback)
+        assert posts._subscribers == ()
+
     def test_get_streaming_resources(self):
         """Test getting streaming resources."""
         registry = MCPResourceRegistry()
@@ -193,6 +686,50 @@ class TestMCPResourceRegistry:
         assert len(polling_resources) == 1
         assert polling_resources[0] == resource
 
+    @pytest.mark.asyncio
+    async def test_start_all_streaming_tolerates_failures(self):
+        """Test that one resource failing to start does not stop the others."""
+        registry = MCPResourceRegistry()
+        failing = NewChannelPostResource()
+        working = ReactionResource()
+        failing.start_streaming = AsyncMock(side_effect=RuntimeError("boom"))
+        working.start_streaming = AsyncMock()
+
+        registry.register(failing)
+        registry.register(working)
+
+        await registry.start_all_streaming()
+
+        failing.start_streaming.assert_awaited_once()
+        working.start_streaming.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_start_all_cancels_resources(self):
+        """Test that cancelling the caller does not orphan resource starts."""
+        registry = MCPResourceRegistry()
+        resource = NewChannelPostResource()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def start_streaming(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        resource.start_streaming = start_streaming
+        registry.register(resource)
+
+        task = asyncio.create_task(registry.start_all_streaming())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert cancelled.is_set()
+
 
 class TestMattermostMCPServer:
     """Test MattermostMCPServer with streaming resources."""
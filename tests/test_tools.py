@@ -0,0 +1,37 @@
+"""
+Tests for the MCP tool registry.
+"""
+
+import pytest
+
+from mcp_mattermost.tools.base import MCPToolDefinition, MCPToolRegistry
+
+
+def _tool(name: str) -> MCPToolDefinition:
+    return MCPToolDefinition(
+        name=name,
+        description=f"{name} tool",
+        input_schema={"type": "object", "properties": {}},
+        handler=lambda: None,
+    )
+
+
+class TestMCPToolRegistry:
+    """Test MCPToolRegistry."""
+
+    def test_list_tools_is_rebuilt_on_register(self):
+        """Test that listed tools reflect registrations and protect the cache."""
+        registry = MCPToolRegistry()
+        registry.register(_tool("first"))
+
+        listed = registry.list_tools()
+        assert [tool["name"] for tool in listed] == ["first"]
+
+        listed[0]["name"] = "renamed"
+        assert registry.list_tools()[0]["name"] == "first"
+        with pytest.raises(TypeError):
+            listed[0]["input_schema"]["properties"]["injected"] = {}
+
+        registry.register(_tool("second"))
+
+        assert [tool["name"] for tool in registry.list_tools()] == ["first", "second"]